@@ -1,4 +1,5 @@
 import hashlib
+import os
 import time
 import logging
 from pathlib import Path
@@ -86,9 +87,11 @@ class RandomizationManager:
         No heavy loading occurs here.
         """
         logger = logging.getLogger(__name__)
-        # Basic config if not already configured (ensures output to console)
+        # Basic config if not already configured (ensures output to console).
+        # DART_GEN_LOG_LEVEL=DEBUG enables per-asset load messages.
         if not logging.getLogger().handlers:
-            logging.basicConfig(level=logging.INFO, format='%(message)s')
+            level = os.environ.get("DART_GEN_LOG_LEVEL", "INFO").upper()
+            logging.basicConfig(level=getattr(logging, level, logging.INFO), format='%(message)s')
 
         start_time = time.perf_counter()
 
@@ -57,7 +57,12 @@ class AnnotationManager:
         )
 
         # World -> camera
-        view = cam_eval.matrix_world.inverted()
+        view = cam_eval.matrix_world.inverted_safe()
+
+        # Convert to NumPy once and chain world -> clip into a single 4x4
+        view_m = np.array(view, dtype=np.float64)
+        proj_m = np.array(proj, dtype=np.float64)
+        proj_view = proj_m @ view_m
 
         # Collect all mesh objects in hierarchy (root + children)
         # (children_recursive gives access to all descendants)
@@ -90,21 +95,12 @@ class AnnotationManager:
             mesh.vertices.foreach_get("co", co)
             co = co.reshape((-1, 3))
 
-            # Homogeneous coords
-            ones = np.ones((co.shape[0], 1), dtype=np.float64)
-            co_h = np.concatenate([co, ones], axis=1)
-
-            # Local -> world
+            # Local -> world -> camera -> clip in one matrix product.
+            # Apply the affine part directly instead of building (N, 4) homogeneous coords.
             mw = np.array(obj_eval.matrix_world, dtype=np.float64)
-            world = (mw @ co_h.T).T
-
-            # World -> camera
-            view_m = np.array(view, dtype=np.float64)
-            cam_space = (view_m @ world.T).T
-
-            # Camera -> clip
-            proj_m = np.array(proj, dtype=np.float64)
-            clip = (proj_m @ cam_space.T).T
+            full = proj_view @ mw
+            clip = co @ full[:, :3].T
+            clip += full[:, 3]
 
             # Perspective divide -> NDC
             w_comp = clip[:, 3]
@@ -1,17 +1,27 @@
 import random
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+# Upper bound (inclusive) of the integer "Seed" inputs of shader and Geometry Nodes groups
+NODE_SEED_MAX = 10000
+
 
 class BaseRandomizer(ABC):
     """
     Abstract base class for all randomizers.
     
     Provides:
-    - Deterministic RNG with seed management
+    - Deterministic RNG with seed management (scalar random.Random and a
+      NumPy Generator for batched draws, seeded together)
     - Common interface (update_seed, randomize)
     - Separation of initialization (constructor) and per-frame randomization
     """
 
+    # Subclasses may declare their own __slots__ for faster attribute access;
+    # those that don't simply get a regular __dict__ on top of these.
+    __slots__ = ("config", "rng", "rng_np")
+
     def __init__(self, seed: int, config):
         """
         Initialize the randomizer with a seed and configuration.
@@ -25,6 +35,7 @@ class BaseRandomizer(ABC):
         """
         self.config = config
         self.rng = random.Random(seed)
+        self.rng_np = np.random.default_rng(seed)
         self._initialize()
 
     @abstractmethod
@@ -47,6 +58,7 @@ class BaseRandomizer(ABC):
             new_seed: New random seed for this frame
         """
         self.rng.seed(new_seed)
+        self.rng_np = np.random.default_rng(new_seed)
 
     @abstractmethod
     def randomize(self, *args, **kwargs) -> None:
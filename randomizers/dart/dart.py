@@ -1,5 +1,8 @@
 import bpy
-from typing import Optional
+from typing import Optional, Dict, List
+
+# Name patterns of the generator objects inside a dart hierarchy
+GENERATOR_NAMES = ("Tip_Generator", "Barrel_Generator", "Shaft_Generator", "Flight_Generator")
 
 class Dart:
     """
@@ -11,11 +14,12 @@ class Dart:
         self.root = root_obj
         self.k_point = k_point_obj
         
-        # Cache child objects
-        self.tip = self._find_child(self.root, "Tip_Generator")
-        self.barrel = self._find_child(self.root, "Barrel_Generator")
-        self.shaft = self._find_child(self.root, "Shaft_Generator")
-        self.flight = self._find_child(self.root, "Flight_Generator")
+        # Cache child objects (single hierarchy walk for all generators)
+        generators = self._build_generator_map(self.root)
+        self.tip = generators.get("Tip_Generator")
+        self.barrel = generators.get("Barrel_Generator")
+        self.shaft = generators.get("Shaft_Generator")
+        self.flight = generators.get("Flight_Generator")
         
         # Cache modifier names
         self.tip_mod = self._get_geo_nodes_modifier_name(self.tip)
@@ -30,6 +34,19 @@ class Dart:
         self.flight_insertion_depth: float = 0.0
         self.flight_index: int = 0
         self.is_visible: bool = True
+        self.hierarchy: Optional[List[bpy.types.Object]] = None
+
+        # Generator materials per part, e.g. "flight" -> material (None if not found)
+        self.materials: Dict[str, Optional[bpy.types.Material]] = {}
+
+        # Material nodes per role, e.g. "flight_bsdf" -> node (None if not found)
+        self.nodes: Dict[str, Optional[bpy.types.Node]] = {}
+
+        # Resolved node input sockets per material node, e.g. "flight_group" -> {name: socket}
+        self.node_sockets: Dict[str, Dict[str, bpy.types.NodeSocket]] = {}
+
+        # Material last written to each generator's "Material" modifier input, by "object|modifier"
+        self.modifier_materials: Dict[str, bpy.types.Material] = {}
 
     def set_visibility(self, visible: bool) -> None:
         """
@@ -37,29 +54,52 @@ class Dart:
         """
         self.is_visible = visible
         
-        # Helper to set visibility for an object and its children recursively
-        def _set_obj_visibility(obj: bpy.types.Object, state: bool):
-            obj.hide_viewport = not state
-            obj.hide_render = not state
-            for child in obj.children:
-                _set_obj_visibility(child, state)
-
-        if self.root:
-            _set_obj_visibility(self.root, visible)
+        hidden = not visible
+        for obj in self._get_hierarchy():
+            obj.hide_viewport = hidden
+            obj.hide_render = hidden
             
         if self.k_point:
             self.k_point.hide_viewport = not visible
             self.k_point.hide_render = not visible
         
-    def _find_child(self, parent: bpy.types.Object, name_part: str) -> Optional[bpy.types.Object]:
-        """Recursive search for a child object by name pattern."""
-        if name_part in parent.name:
-            return parent
-        for child in parent.children:
-            found = self._find_child(child, name_part)
-            if found:
-                return found
-        return None
+    def _get_hierarchy(self) -> List[bpy.types.Object]:
+        """
+        Return the root and all its descendants.
+        Collected once with an iterative walk, since obj.children scans all
+        objects in Blender and the hierarchy does not change after spawning.
+        """
+        if self.hierarchy is None:
+            self.hierarchy = []
+            if self.root:
+                stack = [self.root]
+                while stack:
+                    obj = stack.pop()
+                    self.hierarchy.append(obj)
+                    stack.extend(obj.children)
+        return self.hierarchy
+
+    def _build_generator_map(self, root: bpy.types.Object) -> Dict[str, bpy.types.Object]:
+        """
+        Walk the hierarchy once and map each generator name pattern to the first
+        matching object (depth-first, same order as a per-name recursive search).
+        """
+        found: Dict[str, bpy.types.Object] = {}
+
+        # Iterative pre-order walk; children are pushed reversed to keep the recursive order
+        stack = [root]
+        while stack:
+            obj = stack.pop()
+            name = obj.name
+            for name_part in GENERATOR_NAMES:
+                if name_part not in found and name_part in name:
+                    found[name_part] = obj
+            if len(found) == len(GENERATOR_NAMES):
+                break
+            # obj.children is a scan over all objects in Blender, so stop as soon as possible
+            stack.extend(reversed(obj.children))
+
+        return found
 
     def _get_geo_nodes_modifier_name(self, obj: bpy.types.Object) -> Optional[str]:
         """Find the first Geometry Nodes modifier on the object."""
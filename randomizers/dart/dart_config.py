@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class RangeOrFixed:
     """
     Allows either a fixed value or a range for randomization.
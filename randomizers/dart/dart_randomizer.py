@@ -1,13 +1,33 @@
 import bpy
-from typing import Optional, List, Dict
+import os
+import bisect
+import logging
+from itertools import accumulate
+from typing import Optional, List, Dict, Set, Tuple
 from pathlib import Path
 from mathutils import Vector
-import colorsys
+import numpy as np
 
-from randomizers.base_randomizer import BaseRandomizer
+from randomizers.base_randomizer import BaseRandomizer, NODE_SEED_MAX
 from .dart_config import DartRandomConfig
 from .dart import Dart
-from utils.node_utils import set_geometry_node_input, find_node_group, set_node_input
+from utils.node_utils import set_geometry_node_input, set_geometry_node_inputs, find_node_group, map_node_inputs, set_mapped_input
+from utils.color_utils import hsv_to_rgb_array
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for "not looked up yet", since None is cached for missing materials
+_MISSING = object()
+
+# Upper bound of random colors used per dart (flight gradient + shaft gradient)
+_COLORS_PER_DART = 4
+
+_TEXTURE_EXTENSIONS = frozenset(('.png', '.jpg', '.jpeg', '.tif', '.tiff'))
+
+# Images loaded in this Blender session, keyed by (path, size, mtime_ns).
+# Module level so re-created randomizers reuse them without reloading from disk.
+_IMAGE_INDEX: Dict[Tuple[str, int, int], bpy.types.Image] = {}
+
 
 class DartRandomizer(BaseRandomizer):
     """
@@ -20,43 +40,112 @@ class DartRandomizer(BaseRandomizer):
 
     def __init__(self, seed: int, config: Optional[DartRandomConfig] = None, base_path: Path = None):
         self.base_path = base_path or Path.cwd()
-        self.flight_textures_flags: List[bpy.types.Image] = []
-        self.flight_textures_outpainted: List[bpy.types.Image] = []
+        # Flight texture sets by category ("flags", "outpainted"), loaded on first use
+        self._flight_texture_paths: Dict[str, Path] = {}
+        self._flight_textures: Dict[str, List[bpy.types.Image]] = {}
+        # Keys of warnings already emitted, so missing assets are reported once per run
+        self._warned: Set[str] = set()
+        # Global material fallbacks by name; None marks a material known to be missing
+        self._global_materials: Dict[str, Optional[bpy.types.Material]] = {}
+        # Full names of node trees this randomizer already copied, so they are never copied again
+        self._unique_group_trees: Set[str] = set()
+        # Normalized cumulative mode weights keyed by the raw probability tuple from config
+        self._mode_cdfs: Dict[Tuple[float, ...], List[float]] = {}
+        self._color_batch: Optional[np.ndarray] = None
+        self._color_idx = 0
         super().__init__(seed, config or DartRandomConfig())
 
     def _initialize(self) -> None:
-        """Load flight textures."""
+        """Load the flight texture sets that the current config can sample."""
         base_path = self.base_path / "assets/Textures/Dart/Flight"
-        self.flight_textures_flags = self._load_textures(base_path / "flags")
-        self.flight_textures_outpainted = self._load_textures(base_path / "outpainted")
+        self._flight_texture_paths = {
+            "flags": base_path / "flags",
+            "outpainted": base_path / "outpainted",
+        }
+        self._flight_textures = {}
+        
+        # Sets with zero probability are skipped here and loaded by
+        # _get_flight_textures() if a later config change makes them reachable.
+        if self.config.prob_flight_texture_flags > 0:
+            self._get_flight_textures("flags")
+        if self.config.prob_flight_texture_outpainted > 0:
+            self._get_flight_textures("outpainted")
+
+    def _get_flight_textures(self, category: str) -> List[bpy.types.Image]:
+        """Return the textures of a flight texture category, loading them on first use."""
+        textures = self._flight_textures.get(category)
+        if textures is None:
+            textures = self._load_textures(self._flight_texture_paths[category])
+            self._flight_textures[category] = textures
+        return textures
 
     def _load_textures(self, path: Path) -> List[bpy.types.Image]:
         """Load all images from a directory."""
-        images = []
         if not path.exists():
-            print(f"[DartRandomizer] Warning: Texture path not found: {path}")
-            return images
-            
-        for img_file in path.glob("*"):
-            if img_file.suffix.lower() in ['.png', '.jpg', '.jpeg', '.tif', '.tiff']:
+            logger.warning(f"[DartRandomizer] Texture path not found: {path}")
+            return []
+        
+        # Single directory pass; entry.path is absolute because the scanned path is
+        with os.scandir(os.path.abspath(path)) as it:
+            entries = [e for e in it if os.path.splitext(e.name)[1].lower() in _TEXTURE_EXTENSIONS]
+        
+        images = self._load_texture_files(entries)
+        
+        logger.debug(f"[DartRandomizer] Loaded {len(images)} textures from {path}")
+        return images
+
+    def _load_texture_files(self, entries: List[os.DirEntry]) -> List[bpy.types.Image]:
+        """Load or reload the given image files into bpy.data.images."""
+        images = []
+        # Snapshot once instead of probing bpy.data.images twice per file
+        existing = {img.name: img for img in bpy.data.images}
+        for entry in entries:
+            # Validate up front so only genuine decode errors reach the except below
+            if not entry.is_file():
+                logger.warning(f"[DartRandomizer] Skipping unreadable texture {entry.path}")
+                continue
+            stat = entry.stat()
+            if stat.st_size == 0:
+                logger.warning(f"[DartRandomizer] Skipping empty texture {entry.path}")
+                continue
+
+            # Unchanged file already loaded this session: reuse it without touching the disk
+            key = (entry.path, stat.st_size, stat.st_mtime_ns)
+            img = _IMAGE_INDEX.get(key)
+            if img is not None:
                 try:
-                    # Optimization: Reload existing image instead of remove/load
-                    # This preserves references in materials and is faster than removing used datablocks
-                    if img_file.name in bpy.data.images:
-                        img = bpy.data.images[img_file.name]
-                        # Force reload from disk to get latest changes
-                        img.reload()
-                    else:
-                        # Use absolute path to ensure Blender finds the file
-                        img = bpy.data.images.load(str(img_file.resolve()), check_existing=True)
-                    
-                    img.use_fake_user = True
-                    images.append(img)
-                except Exception as e:
-                    print(f"[DartRandomizer] Failed to load texture {img_file}: {e}")
-        print(f"[DartRandomizer] Loaded {len(images)} textures from {path}")
+                    img.name  # Raises if the datablock was removed (e.g. another .blend was opened)
+                except ReferenceError:
+                    img = None
+
+            if img is None:
+                # Optimization: Reload existing image instead of remove/load
+                # This preserves references in materials and is faster than removing used datablocks
+                img = existing.get(entry.name)
+                if img is not None:
+                    # Force reload from disk to get latest changes
+                    img.reload()
+                else:
+                    try:
+                        # Absolute path so Blender finds the file
+                        img = bpy.data.images.load(entry.path, check_existing=True)
+                    except RuntimeError as e:
+                        logger.warning(f"[DartRandomizer] Failed to load texture {entry.path}: {e}")
+                        continue
+                _IMAGE_INDEX[key] = img
+
+            if not img.use_fake_user:
+                img.use_fake_user = True
+            images.append(img)
         return images
 
+    def _warn_once(self, key: str, message: str) -> None:
+        """Log a warning only the first time it occurs for the given key."""
+        if key in self._warned:
+            return
+        self._warned.add(key)
+        logger.warning(message)
+
     def setup_geometry_references(self, dart: Dart) -> None:
         """
         Links the Geometry Nodes 'Parent_Object' inputs for the dart hierarchy.
@@ -82,13 +171,16 @@ class DartRandomizer(BaseRandomizer):
             dart: The Dart instance to randomize.
         """
         if not dart or not dart.root:
-            print("[DartRandomizer] No valid dart instance provided.")
+            logger.warning("[DartRandomizer] No valid dart instance provided.")
             return
 
         self._randomize_generators(dart)
         
         self._update_dart_size(dart)
         
+        # Draw all colors this dart may need in one vectorized call
+        self._draw_color_batch()
+        
         # Pass dart to material randomizers
         self._randomize_flight_material(dart)
         self._randomize_shaft_material(dart)
@@ -111,316 +203,388 @@ class DartRandomizer(BaseRandomizer):
         
         return None
 
+    def _get_dart_material(self, dart: Dart, key: str, generator_obj: bpy.types.Object, material_prefix: str) -> Optional[bpy.types.Material]:
+        """Find the generator material of a dart once and cache it on the wrapper."""
+        material = dart.materials.get(key, _MISSING)
+        if material is _MISSING:
+            material = self._get_material_from_generator(generator_obj, material_prefix)
+            dart.materials[key] = material
+        return material
+
+    def _get_global_material(self, name: str) -> Optional[bpy.types.Material]:
+        """Look up a material in bpy.data once and cache the result, including misses."""
+        material = self._global_materials.get(name, _MISSING)
+        if material is _MISSING:
+            material = bpy.data.materials.get(name)
+            self._global_materials[name] = material
+        return material
+
     def _randomize_generators(self, dart: Dart) -> None:
+        # Bind hot attributes to locals once for the whole method
+        rng = self.rng
+        randint = rng.randint
+        cfg = self.config
+
         # 1. Tip Generator
         if dart.tip:
-            length = self.config.tip_length.get_value(self.rng)
+            length = cfg.tip_length.get_value(rng)
             dart.tip_length = length # Cache value
-            set_geometry_node_input(dart.tip, dart.tip_mod, "Length", length)
-            set_geometry_node_input(dart.tip, dart.tip_mod, "Seed", self.rng.randint(0, 10000))
-            dart.tip.update_tag()
+            set_geometry_node_inputs(dart.tip, dart.tip_mod, {
+                "Length": length,
+                "Seed": randint(0, NODE_SEED_MAX),
+            })
 
         # 2. Barrel Generator
         if dart.barrel:
-            length = self.config.barrel_length.get_value(self.rng)
-            thickness = self.config.barrel_thickness.get_value(self.rng)
+            length = cfg.barrel_length.get_value(rng)
+            thickness = cfg.barrel_thickness.get_value(rng)
             dart.barrel_length = length # Cache value
-            set_geometry_node_input(dart.barrel, dart.barrel_mod, "Length", length)
-            set_geometry_node_input(dart.barrel, dart.barrel_mod, "Thickness", thickness)
-            set_geometry_node_input(dart.barrel, dart.barrel_mod, "Seed", self.rng.randint(0, 10000))
-            dart.barrel.update_tag()
+            set_geometry_node_inputs(dart.barrel, dart.barrel_mod, {
+                "Length": length,
+                "Thickness": thickness,
+                "Seed": randint(0, NODE_SEED_MAX),
+            })
 
         # 3. Shaft Generator
         if dart.shaft:
-            length = self.config.shaft_length.get_value(self.rng)
-            mix = self.config.shaft_shape_mix.get_value(self.rng)
+            length = cfg.shaft_length.get_value(rng)
+            mix = cfg.shaft_shape_mix.get_value(rng)
             dart.shaft_length = length # Cache value
-            set_geometry_node_input(dart.shaft, dart.shaft_mod, "Length", length)
-            set_geometry_node_input(dart.shaft, dart.shaft_mod, "Shape_mix_factor", mix)
-            set_geometry_node_input(dart.shaft, dart.shaft_mod, "Seed", self.rng.randint(0, 10000))
-            dart.shaft.update_tag()
+            set_geometry_node_inputs(dart.shaft, dart.shaft_mod, {
+                "Length": length,
+                "Shape_mix_factor": mix,
+                "Seed": randint(0, NODE_SEED_MAX),
+            })
 
         # 4. Flight Generator
         if dart.flight:
-            depth = self.config.flight_insertion_depth.get_value(self.rng)
+            depth = cfg.flight_insertion_depth.get_value(rng)
             dart.flight_insertion_depth = depth # Cache value
-            set_geometry_node_input(dart.flight, dart.flight_mod, "Insertion_depth", depth)
             
             # Instance Index
             # Hardcoded max count of flight types
             count = 105
             
-            if self.config.randomize_flight_type:
-                idx = self.rng.randint(0, count - 1)
+            if cfg.randomize_flight_type:
+                idx = randint(0, count - 1)
             else:
-                idx = self.config.fixed_flight_index % count
+                idx = cfg.fixed_flight_index % count
             
             dart.flight_index = idx # Cache value
-            set_geometry_node_input(dart.flight, dart.flight_mod, "Instance_index", idx)
-            
-            dart.flight.update_tag()
+            set_geometry_node_inputs(dart.flight, dart.flight_mod, {
+                "Insertion_depth": depth,
+                "Instance_index": idx,
+            })
+
+        # Tag all generators once, after every input has been written
+        for generator in (dart.tip, dart.barrel, dart.shaft, dart.flight):
+            if generator:
+                generator.update_tag()
 
-    def _assign_material_to_modifier(self, obj: bpy.types.Object, mod_name: str, material: bpy.types.Material) -> None:
+    def _assign_material_to_modifier(self, dart: Dart, obj: bpy.types.Object, mod_name: str, material: bpy.types.Material) -> None:
         """
         Assigns the given material to the Geometry Nodes modifier input named 'Material'.
         This ensures the Geometry Nodes use the unique material instance.
+        Skipped if the same material was already assigned, since every write tags the depsgraph.
         """
+        key = f"{obj.name}|{mod_name}"
+        if dart.modifier_materials.get(key) == material:
+            return
+
         # Try to set "Material" input
-        set_geometry_node_input(obj, mod_name, "Material", material)
+        if set_geometry_node_input(obj, mod_name, "Material", material):
+            dart.modifier_materials[key] = material
 
-    def _ensure_unique_node_group(self, group_node: bpy.types.Node) -> None:
+    def _ensure_unique_node_group(self, group_node: bpy.types.Node) -> bool:
         """
         Ensures that the node group used by this node is unique (a copy).
         This prevents changes to the node group from affecting other materials/objects.
+        
+        Returns:
+            True if the node tree was replaced by a copy
         """
-        if not group_node.node_tree:
-            return
-            
+        tree = group_node.node_tree
+        if not tree:
+            return False
+
+        # Trees we created ourselves are unique by construction, skip the users query
+        if tree.name_full in self._unique_group_trees:
+            return False
+
         # Optimization: If the node tree has only 1 user, it is already unique to this material.
         # Since we deep-copied the material for each dart, if we also deep-copied the node group once,
         # it will have users=1 (the current material).
-        if group_node.node_tree.users <= 1:
-            return
+        if tree.users <= 1:
+            return False
 
         # Simply duplicate it to be safe and assign the copy
         # We append a suffix to identify it as a unique copy
-        original_tree = group_node.node_tree
-        new_tree = original_tree.copy()
-        new_tree.name = f"{original_tree.name}_Unique"
+        new_tree = tree.copy()
+        new_tree.name = f"{tree.name}_Unique"
         group_node.node_tree = new_tree
+        self._unique_group_trees.add(new_tree.name_full)
+        return True
+
+    def _get_bsdf(self, dart: Dart, key: str, material: bpy.types.Material) -> Optional[bpy.types.Node]:
+        """Find the Principled BSDF node of a material once per dart."""
+        bsdf = dart.nodes.get(key, _MISSING)
+        if bsdf is _MISSING:
+            bsdf = None
+            for node in material.node_tree.nodes:
+                if node.type == 'BSDF_PRINCIPLED':
+                    bsdf = node
+                    break
+            dart.nodes[key] = bsdf
+        return bsdf
+
+    def _get_group_node(self, dart: Dart, key: str, material: bpy.types.Material, group_name: str) -> Optional[bpy.types.Node]:
+        """Find a node group in a material once per dart."""
+        group_node = dart.nodes.get(key, _MISSING)
+        if group_node is _MISSING:
+            group_node = find_node_group(material.node_tree, group_name)
+            dart.nodes[key] = group_node
+        return group_node
+
+    def _get_sockets(self, dart: Dart, key: str, node: bpy.types.Node) -> Dict[str, bpy.types.NodeSocket]:
+        """Return the input sockets of a material node, resolved once per dart."""
+        sockets = dart.node_sockets.get(key)
+        if sockets is None:
+            sockets = map_node_inputs(node)
+            dart.node_sockets[key] = sockets
+        return sockets
+
+    def _choose_mode(self, probs: Tuple[float, ...]) -> int:
+        """
+        Pick a mode index with the given (unnormalized) probabilities.
+        Falls back to an equal distribution if all probabilities are zero.
+        """
+        cdf = self._mode_cdfs.get(probs)
+        if cdf is None:
+            total = sum(probs)
+            weights = probs if total > 0 else (1.0,) * len(probs)
+            total = total if total > 0 else float(len(probs))
+            cdf = list(accumulate(p / total for p in weights))
+            self._mode_cdfs[probs] = cdf
+        # hi excludes the last bucket so float rounding below 1.0 can never overflow
+        return bisect.bisect(cdf, self.rng.random(), 0, len(cdf) - 1)
 
     def _randomize_flight_material(self, dart: Dart) -> None:
         """Randomize the flight material (texture, gradient, solid color, roughness)."""
-        material = self._get_material_from_generator(dart.flight, "Flight")
+        material = self._get_dart_material(dart, "flight", dart.flight, "Flight")
         
         if not material:
             # Fallback to global lookup if not found on object (legacy behavior)
-            if "Flight" in bpy.data.materials:
-                material = bpy.data.materials["Flight"]
-            else:
-                print(f"[DartRandomizer] Material 'Flight' not found on object or globally")
+            material = self._get_global_material("Flight")
+            if not material:
+                self._warn_once("mat:Flight", "[DartRandomizer] Material 'Flight' not found on object or globally")
                 return
 
         # Ensure Geometry Nodes use this specific material instance
         if dart.flight:
-             self._assign_material_to_modifier(dart.flight, dart.flight_mod, material)
+             self._assign_material_to_modifier(dart, dart.flight, dart.flight_mod, material)
             
         if not material.use_nodes:
             return
 
         # 1. Randomize Roughness on Principled BSDF
-        bsdf = None
-        for node in material.node_tree.nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                bsdf = node
-                break
+        bsdf = self._get_bsdf(dart, "flight_bsdf", material)
         
         if bsdf:
+            bsdf_sockets = self._get_sockets(dart, "flight_bsdf", bsdf)
             roughness = self.config.flight_roughness.get_value(self.rng)
-            set_node_input(bsdf, "Roughness", roughness)
+            set_mapped_input(bsdf_sockets, "Roughness", roughness)
 
         # 2. Find Flight_Texture Node Group
-        group_node = find_node_group(material.node_tree, "Flight_Texture")
+        group_node = self._get_group_node(dart, "flight_group", material, "Flight_Texture")
         if not group_node:
-            print(f"[DartRandomizer] Node Group 'Flight_Texture' not found in material '{material.name}'")
+            self._warn_once(f"group:Flight_Texture:{material.name}", f"[DartRandomizer] Node Group 'Flight_Texture' not found in material '{material.name}'")
             return
             
         # IMPORTANT: Make the node group unique for this material instance
         # because we might modify its internal nodes (Image Texture)
-        self._ensure_unique_node_group(group_node)
+        if self._ensure_unique_node_group(group_node):
+            dart.node_sockets.pop("flight_group", None)
+        group_sockets = self._get_sockets(dart, "flight_group", group_node)
 
         # 3. Determine Mode
         # Modes: 0=Flags, 1=Outpainted, 2=Gradient, 3=Solid
-        probs = [
+        mode = self._choose_mode((
             self.config.prob_flight_texture_flags,
             self.config.prob_flight_texture_outpainted,
             self.config.prob_flight_gradient,
             self.config.prob_flight_solid
-        ]
-        
-        # Normalize probabilities if they don't sum to 1
-        total_prob = sum(probs)
-        if total_prob > 0:
-            probs = [p / total_prob for p in probs]
-        else:
-            probs = [0.25, 0.25, 0.25, 0.25] # Fallback equal distribution
-
-        mode = self.rng.choices(range(4), weights=probs, k=1)[0]
+        ))
 
         if mode == 0: # Flags
-            self._set_flight_texture(group_node, self.flight_textures_flags)
-            set_node_input(group_node, "Mix_factor_1", 0.0)
-            set_node_input(group_node, "Mix_factor_2", 0.0)
+            self._set_flight_texture(group_node, self._get_flight_textures("flags"))
+            set_mapped_input(group_sockets, "Mix_factor_1", 0.0)
+            set_mapped_input(group_sockets, "Mix_factor_2", 0.0)
             
         elif mode == 1: # Outpainted
-            self._set_flight_texture(group_node, self.flight_textures_outpainted)
-            set_node_input(group_node, "Mix_factor_1", 0.0)
-            set_node_input(group_node, "Mix_factor_2", 0.0)
+            self._set_flight_texture(group_node, self._get_flight_textures("outpainted"))
+            set_mapped_input(group_sockets, "Mix_factor_1", 0.0)
+            set_mapped_input(group_sockets, "Mix_factor_2", 0.0)
             
         elif mode == 2: # Gradient
             col1 = self._get_random_color()
             col2 = self._get_random_color()
-            set_node_input(group_node, "Gradient_color_1", col1)
-            set_node_input(group_node, "Gradient_color_2", col2)
-            set_node_input(group_node, "Mix_factor_1", 1.0)
-            set_node_input(group_node, "Mix_factor_2", 0.0)
+            set_mapped_input(group_sockets, "Gradient_color_1", col1)
+            set_mapped_input(group_sockets, "Gradient_color_2", col2)
+            set_mapped_input(group_sockets, "Mix_factor_1", 1.0)
+            set_mapped_input(group_sockets, "Mix_factor_2", 0.0)
             
         elif mode == 3: # Solid
             col = self._get_random_color()
-            set_node_input(group_node, "Solid_color", col)
+            set_mapped_input(group_sockets, "Solid_color", col)
             # Mix_factor_1 can be anything, Mix_factor_2 must be 1.0
-            set_node_input(group_node, "Mix_factor_2", 1.0)
+            set_mapped_input(group_sockets, "Mix_factor_2", 1.0)
 
     def _randomize_shaft_material(self, dart: Dart) -> None:
         """Randomize the shaft material (gradient, solid color, roughness, metallic)."""
-        material = self._get_material_from_generator(dart.shaft, "Shaft")
+        material = self._get_dart_material(dart, "shaft", dart.shaft, "Shaft")
         
         if not material:
-            if "Shaft" in bpy.data.materials:
-                material = bpy.data.materials["Shaft"]
-            else:
-                print(f"[DartRandomizer] Material 'Shaft' not found")
+            material = self._get_global_material("Shaft")
+            if not material:
+                self._warn_once("mat:Shaft", "[DartRandomizer] Material 'Shaft' not found")
                 return
 
         # Ensure Geometry Nodes use this specific material instance
         if dart.shaft:
-             self._assign_material_to_modifier(dart.shaft, dart.shaft_mod, material)
+             self._assign_material_to_modifier(dart, dart.shaft, dart.shaft_mod, material)
             
         if not material.use_nodes:
             return
 
         # 1. Randomize Principled BSDF (Roughness, Metallic)
-        bsdf = None
-        for node in material.node_tree.nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                bsdf = node
-                break
+        bsdf = self._get_bsdf(dart, "shaft_bsdf", material)
         
         if bsdf:
+            bsdf_sockets = self._get_sockets(dart, "shaft_bsdf", bsdf)
             # Roughness
             roughness = self.config.shaft_roughness.get_value(self.rng)
-            set_node_input(bsdf, "Roughness", roughness)
+            set_mapped_input(bsdf_sockets, "Roughness", roughness)
             
             # Metallic
             is_metallic = self.rng.random() < self.config.prob_shaft_metallic
-            set_node_input(bsdf, "Metallic", 1.0 if is_metallic else 0.0)
+            set_mapped_input(bsdf_sockets, "Metallic", 1.0 if is_metallic else 0.0)
 
         # 2. Find Shaft_Texture Node Group
-        group_node = find_node_group(material.node_tree, "Shaft_Texture")
+        group_node = self._get_group_node(dart, "shaft_group", material, "Shaft_Texture")
         if not group_node:
-            print(f"[DartRandomizer] Node Group 'Shaft_Texture' not found in material '{material.name}'")
+            self._warn_once(f"group:Shaft_Texture:{material.name}", f"[DartRandomizer] Node Group 'Shaft_Texture' not found in material '{material.name}'")
             return
             
         # IMPORTANT: Make the node group unique for this material instance
-        self._ensure_unique_node_group(group_node)
+        if self._ensure_unique_node_group(group_node):
+            dart.node_sockets.pop("shaft_group", None)
+        group_sockets = self._get_sockets(dart, "shaft_group", group_node)
 
         # 3. Determine Mode
         # Modes: 0=Gradient, 1=Solid
-        probs = [
+        mode = self._choose_mode((
             self.config.prob_shaft_gradient,
             self.config.prob_shaft_solid
-        ]
-        
-        # Normalize
-        total_prob = sum(probs)
-        if total_prob > 0:
-            probs = [p / total_prob for p in probs]
-        else:
-            probs = [0.5, 0.5]
-
-        mode = self.rng.choices(range(2), weights=probs, k=1)[0]
+        ))
 
         if mode == 0: # Gradient
             col1 = self._get_random_color()
             col2 = self._get_random_color()
-            set_node_input(group_node, "Gradient_color_1", col1)
-            set_node_input(group_node, "Gradient_color_2", col2)
-            set_node_input(group_node, "Mix_factor", 0.0)
+            set_mapped_input(group_sockets, "Gradient_color_1", col1)
+            set_mapped_input(group_sockets, "Gradient_color_2", col2)
+            set_mapped_input(group_sockets, "Mix_factor", 0.0)
             
         elif mode == 1: # Solid
             col = self._get_random_color()
-            set_node_input(group_node, "Solid_color", col)
-            set_node_input(group_node, "Mix_factor", 1.0)
+            set_mapped_input(group_sockets, "Solid_color", col)
+            set_mapped_input(group_sockets, "Mix_factor", 1.0)
 
     def _randomize_barrel_material(self, dart: Dart) -> None:
         """Randomize the barrel material (seed, roughness)."""
-        material = self._get_material_from_generator(dart.barrel, "Barrel_Domain_Randomization")
+        material = self._get_dart_material(dart, "barrel", dart.barrel, "Barrel_Domain_Randomization")
         
         if not material:
-            if "Barrel_Domain_Randomization" in bpy.data.materials:
-                material = bpy.data.materials["Barrel_Domain_Randomization"]
-            else:
-                print(f"[DartRandomizer] Material 'Barrel_Domain_Randomization' not found")
+            material = self._get_global_material("Barrel_Domain_Randomization")
+            if not material:
+                self._warn_once("mat:Barrel_Domain_Randomization", "[DartRandomizer] Material 'Barrel_Domain_Randomization' not found")
                 return
 
         # Ensure Geometry Nodes use this specific material instance
         if dart.barrel:
-             self._assign_material_to_modifier(dart.barrel, dart.barrel_mod, material)
+             self._assign_material_to_modifier(dart, dart.barrel, dart.barrel_mod, material)
             
         if not material.use_nodes:
             return
 
         # 1. Randomize Principled BSDF (Roughness)
-        bsdf = None
-        for node in material.node_tree.nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                bsdf = node
-                break
+        bsdf = self._get_bsdf(dart, "barrel_bsdf", material)
         
         if bsdf:
+            bsdf_sockets = self._get_sockets(dart, "barrel_bsdf", bsdf)
             roughness = self.config.barrel_roughness.get_value(self.rng)
-            set_node_input(bsdf, "Roughness", roughness)
+            set_mapped_input(bsdf_sockets, "Roughness", roughness)
 
         # 2. Find Node Group and set Seed
-        group_node = find_node_group(material.node_tree, "NG_Barrel_Domain_Randomization")
+        group_node = self._get_group_node(dart, "barrel_group", material, "NG_Barrel_Domain_Randomization")
         if group_node:
-            set_node_input(group_node, "Seed", self.rng.randint(0, 10000))
+            group_sockets = self._get_sockets(dart, "barrel_group", group_node)
+            set_mapped_input(group_sockets, "Seed", self.rng.randint(0, NODE_SEED_MAX))
         else:
-            print(f"[DartRandomizer] Node Group 'NG_Barrel_Domain_Randomization' not found in material '{material.name}'")
+            self._warn_once(f"group:NG_Barrel_Domain_Randomization:{material.name}", f"[DartRandomizer] Node Group 'NG_Barrel_Domain_Randomization' not found in material '{material.name}'")
 
     def _randomize_tip_material(self, dart: Dart) -> None:
         """Randomize the tip material (seed, roughness)."""
-        material = self._get_material_from_generator(dart.tip, "Tip_Domain_Randomization")
+        material = self._get_dart_material(dart, "tip", dart.tip, "Tip_Domain_Randomization")
         
         if not material:
-            if "Tip_Domain_Randomization" in bpy.data.materials:
-                material = bpy.data.materials["Tip_Domain_Randomization"]
-            else:
-                print(f"[DartRandomizer] Material 'Tip_Domain_Randomization' not found")
+            material = self._get_global_material("Tip_Domain_Randomization")
+            if not material:
+                self._warn_once("mat:Tip_Domain_Randomization", "[DartRandomizer] Material 'Tip_Domain_Randomization' not found")
                 return
 
         # Ensure Geometry Nodes use this specific material instance
         if dart.tip:
-             self._assign_material_to_modifier(dart.tip, dart.tip_mod, material)
+             self._assign_material_to_modifier(dart, dart.tip, dart.tip_mod, material)
             
         if not material.use_nodes:
             return
 
         # 1. Randomize Principled BSDF (Roughness)
-        bsdf = None
-        for node in material.node_tree.nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                bsdf = node
-                break
+        bsdf = self._get_bsdf(dart, "tip_bsdf", material)
         
         if bsdf:
+            bsdf_sockets = self._get_sockets(dart, "tip_bsdf", bsdf)
             roughness = self.config.tip_roughness.get_value(self.rng)
-            set_node_input(bsdf, "Roughness", roughness)
+            set_mapped_input(bsdf_sockets, "Roughness", roughness)
 
         # 2. Find Node Group and set Seed
-        group_node = find_node_group(material.node_tree, "NG_Tip_Domain_Randomization")
+        group_node = self._get_group_node(dart, "tip_group", material, "NG_Tip_Domain_Randomization")
         if group_node:
-            set_node_input(group_node, "Seed", self.rng.randint(0, 10000))
+            group_sockets = self._get_sockets(dart, "tip_group", group_node)
+            set_mapped_input(group_sockets, "Seed", self.rng.randint(0, NODE_SEED_MAX))
         else:
-            print(f"[DartRandomizer] Node Group 'NG_Tip_Domain_Randomization' not found in material '{material.name}'")
+            self._warn_once(f"group:NG_Tip_Domain_Randomization:{material.name}", f"[DartRandomizer] Node Group 'NG_Tip_Domain_Randomization' not found in material '{material.name}'")
+
+    def _draw_color_batch(self) -> None:
+        """Generate the random saturated colors for one dart based on config."""
+        c = self.config
+        n = _COLORS_PER_DART
+        h = self.rng_np.random(n)
+        s = self.rng_np.uniform(c.flight_color_saturation_min, c.flight_color_saturation_max, n)
+        v = self.rng_np.uniform(c.flight_color_value_min, c.flight_color_value_max, n)
+        
+        batch = np.ones((n, 4), dtype=np.float64)
+        batch[:, :3] = hsv_to_rgb_array(h, s, v)
+        self._color_batch = batch
+        self._color_idx = 0
 
     def _get_random_color(self):
-        """Helper to generate random saturated color based on config."""
-        h = self.rng.random()
-        s = self.rng.uniform(self.config.flight_color_saturation_min, self.config.flight_color_saturation_max)
-        v = self.rng.uniform(self.config.flight_color_value_min, self.config.flight_color_value_max)
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return (r, g, b, 1.0)
+        """Return the next color from the current batch."""
+        if self._color_batch is None or self._color_idx >= len(self._color_batch):
+            self._draw_color_batch()
+        color = tuple(self._color_batch[self._color_idx].tolist())
+        self._color_idx += 1
+        return color
 
     def _set_flight_texture(self, group_node: bpy.types.Node, texture_list: List[bpy.types.Image]) -> None:
         """Pick a random texture from the list and assign it to the Image Texture node inside the group."""
@@ -439,17 +603,23 @@ class DartRandomizer(BaseRandomizer):
         if img_node:
             img_node.image = image
         else:
-            print("[DartRandomizer] Image Texture node not found inside 'Flight_Texture' group")
+            self._warn_once("node:Flight_Texture:TEX_IMAGE", "[DartRandomizer] Image Texture node not found inside 'Flight_Texture' group")
 
     def _update_dart_size(self, dart: Dart) -> None:
         """
         Read the total length from the Flight generator's output attribute
         and update the root Empty's display size.
         """
-        if not dart or not dart.root or not dart.flight:
+        if not dart or not dart.root:
+            return
+
+        # The length is composed from the four generators only; bail out early if any
+        # of them is missing instead of touching the rest of the scene.
+        generators = (dart.tip, dart.barrel, dart.shaft, dart.flight)
+        if not all(generators):
             return
 
         flight_insertion_depth_m = dart.flight_insertion_depth / 1000.0
 
-        length_m = dart.tip.dimensions[2] + dart.barrel.dimensions[2] + dart.shaft.dimensions[2] + dart.flight.dimensions[2] - flight_insertion_depth_m
+        length_m = sum(gen.dimensions[2] for gen in generators) - flight_insertion_depth_m
         dart.root.empty_display_size = length_m
@@ -1,4 +1,4 @@
-from .dartboard_config import DartboardRandomConfig, RangeOrFixed, ColorVariation
+from .dartboard_config import DartboardRandomConfig, RangeOrFixed, ColorVariation, MaterialNames, NodeGroupNames
 from .dartboard_randomizer import DartboardRandomizer
 
 __all__ = [
@@ -6,4 +6,6 @@ __all__ = [
     "DartboardRandomConfig",
     "RangeOrFixed",
     "ColorVariation",
+    "MaterialNames",
+    "NodeGroupNames",
 ]
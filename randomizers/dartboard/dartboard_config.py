@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RangeOrFixed:
     """
     Allows either a fixed value or a range for randomization.
@@ -20,12 +20,18 @@ class RangeOrFixed:
             return self.fixed
         return rng.uniform(self.min_val, self.max_val)
     
+    def value_at(self, u: float) -> float:
+        """Like get_value, but maps a pre-drawn uniform sample u in [0, 1) into the range."""
+        if self.fixed is not None:
+            return self.fixed
+        return self.min_val + (self.max_val - self.min_val) * u
+    
     def is_randomized(self) -> bool:
         """Checks if this parameter is being randomized."""
         return self.fixed is None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorVariation:
     """
     Configuration for color variations in HSV color space.
@@ -40,7 +46,29 @@ class ColorVariation:
     randomize: bool = True            # Whether to randomize color
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class MaterialNames:
+    """
+    Names of the dartboard materials in the .blend file.
+    """
+    score_red: str = "red_score_texture_material"
+    score_green: str = "green_score_texture_material"
+    score_white: str = "white_score_texture_material"
+    score_black: str = "black_score_texture_material"
+    number_ring: str = "number_ring"
+
+
+@dataclass(frozen=True, slots=True)
+class NodeGroupNames:
+    """
+    Names of the shader node groups inside the dartboard materials.
+    """
+    score_white_and_color: str = "group_white_and_color_score_texture"
+    score_black: str = "group_black_score_texture"
+    digit_wear: str = "group_digit_wear"
+
+
+@dataclass(frozen=True, slots=True)
 class DartboardRandomConfig:
     """
     Configuration for dartboard material randomization.
@@ -119,22 +147,12 @@ class DartboardRandomConfig:
     # -------------------------------------------------------------------------
     # Material name mapping (for easy adjustment when names change)
     # -------------------------------------------------------------------------
-    material_names: dict = field(default_factory=lambda: {
-        "score_red": "red_score_texture_material",
-        "score_green": "green_score_texture_material",
-        "score_white": "white_score_texture_material",
-        "score_black": "black_score_texture_material",
-        "number_ring": "number_ring",
-    })
+    material_names: MaterialNames = field(default_factory=MaterialNames)
     
     # -------------------------------------------------------------------------
     # Node group names (for easy adjustment)
     # -------------------------------------------------------------------------
-    node_group_names: dict = field(default_factory=lambda: {
-        "score_white_and_color": "group_white_and_color_score_texture",
-        "score_black": "group_black_score_texture",
-        "digit_wear": "group_digit_wear",
-    })
+    node_group_names: NodeGroupNames = field(default_factory=NodeGroupNames)
     
     # -------------------------------------------------------------------------
     # Geometry Nodes configuration
@@ -1,10 +1,28 @@
 import bpy
-from typing import Optional, Tuple
+import numpy as np
+from dataclasses import asdict
+from typing import Optional, Tuple, List, Dict
 
-from randomizers.base_randomizer import BaseRandomizer
-from .dartboard_config import DartboardRandomConfig, ColorVariation
-from utils.node_utils import find_node_group, set_node_input, set_geometry_node_input
-from utils.color_utils import randomize_color_hsv
+from randomizers.base_randomizer import BaseRandomizer, NODE_SEED_MAX
+from .dartboard_config import DartboardRandomConfig
+from utils.node_utils import find_node_group, map_node_inputs, find_mapped_input, set_mapped_input, get_geometry_node_input_identifier
+from utils.color_utils import randomize_colors_hsv, randomize_colors_value
+
+# Score materials (config.material_names field) and the config attribute holding their field color
+_SCORE_MATERIALS = (
+    ("score_red", "field_color_red"),
+    ("score_green", "field_color_green"),
+    ("score_white", "field_color_white"),
+    ("score_black", "field_color_black"),
+)
+
+# Every ColorVariation in the config, jittered together in one batch per frame
+_COLOR_ATTRS = tuple(color_attr for _, color_attr in _SCORE_MATERIALS) + ("digit_color",)
+
+
+def _to_seed(u: float) -> int:
+    """Map a uniform sample in [0, 1) to an integer seed in [0, NODE_SEED_MAX]."""
+    return int(u * (NODE_SEED_MAX + 1))
 
 
 class DartboardRandomizer(BaseRandomizer):
@@ -19,6 +37,15 @@ class DartboardRandomizer(BaseRandomizer):
     - Geometry Nodes modifiers (future)
     """
 
+    __slots__ = (
+        "_node_cache_key", "_score_seed_inputs", "_score_crack_inputs",
+        "_score_hole_inputs", "_score_color_inputs", "_digit_sockets",
+        "_gn_cache_key", "_gn_targets",
+        "_colors_config", "_static_colors", "_jitter_attrs",
+        "_base_colors", "_color_variations",
+        "_value_attrs", "_value_base_colors", "_value_variations",
+    )
+
     def __init__(self, seed: int, config: Optional[DartboardRandomConfig] = None):
         """
         Initialize the DartboardRandomizer.
@@ -27,6 +54,30 @@ class DartboardRandomizer(BaseRandomizer):
             seed: Initial seed for deterministic randomization
             config: Configuration for randomization
         """
+        # Input sockets of the resolved node groups, rebuilt whenever the
+        # configured material/group names change
+        self._node_cache_key: Optional[tuple] = None
+        # Score inputs are grouped per socket (not per material) so each shared
+        # value is written in one straight loop
+        self._score_seed_inputs: List[bpy.types.NodeSocket] = []
+        self._score_crack_inputs: List[bpy.types.NodeSocket] = []
+        self._score_hole_inputs: List[bpy.types.NodeSocket] = []
+        self._score_color_inputs: List[Tuple[bpy.types.NodeSocket, str]] = []
+        self._digit_sockets: Optional[Dict[str, bpy.types.NodeSocket]] = None
+        # (object, modifier, Seed input identifier) of the configured Geometry Nodes
+        # modifiers, keyed like the node groups
+        self._gn_cache_key: Optional[tuple] = None
+        self._gn_targets: List[Tuple[bpy.types.Object, bpy.types.Modifier, str]] = []
+        # Color arrays of the config they were built from; the config is frozen,
+        # so identity tells whether they are still valid
+        self._colors_config: Optional[DartboardRandomConfig] = None
+        self._static_colors: Dict[str, Tuple[float, float, float, float]] = {}
+        self._jitter_attrs: Tuple[str, ...] = ()
+        self._base_colors: Optional[np.ndarray] = None
+        self._color_variations: Optional[np.ndarray] = None
+        self._value_attrs: Tuple[str, ...] = ()
+        self._value_base_colors: Optional[np.ndarray] = None
+        self._value_variations: Optional[np.ndarray] = None
         super().__init__(seed, config or DartboardRandomConfig())
 
     # -------------------------------------------------------------------------
@@ -37,22 +88,89 @@ class DartboardRandomizer(BaseRandomizer):
         """
         Initialization at startup.
         
+        Validates the configured materials and resolves their node groups.
         Geometry Nodes modifiers could be cached here later.
-        Currently no heavy initialization needed.
         """
         # Validate that required materials exist
         self._validate_materials()
+        self._resolve_node_groups()
+        self._resolve_geometry_targets()
 
     def _validate_materials(self) -> None:
         """Check if configured materials exist."""
-        missing = []
-        for key, mat_name in self.config.material_names.items():
-            if mat_name not in bpy.data.materials:
-                missing.append(f"{key}: {mat_name}")
+        material_names = asdict(self.config.material_names)
+        missing_names = set(material_names.values()).difference(bpy.data.materials.keys())
         
-        if missing:
+        if missing_names:
+            missing = [f"{key}: {mat_name}" for key, mat_name in material_names.items() if mat_name in missing_names]
             print(f"[DartboardRandomizer] Warning - Materials not found: {missing}")
 
+    def _resolve_geometry_targets(self) -> None:
+        """Look up the configured Geometry Nodes modifiers and their Seed input once (per config change)."""
+        key = tuple(self.config.geometry_node_modifiers.items())
+        if key == self._gn_cache_key:
+            return
+        self._gn_cache_key = key
+        
+        self._gn_targets = []
+        for obj_name, modifier_name in key:
+            obj = bpy.data.objects.get(obj_name)
+            if not obj:
+                print(f"[DartboardRandomizer] Object '{obj_name}' not found")
+                continue
+            
+            modifier = obj.modifiers.get(modifier_name)
+            if not modifier or modifier.type != 'NODES':
+                print(f"[DartboardRandomizer] Geometry Nodes modifier '{modifier_name}' not found on '{obj_name}'")
+                continue
+            identifier = get_geometry_node_input_identifier(modifier, "Seed")
+            if identifier is None:
+                print(f"[DartboardRandomizer] No Seed input on '{modifier_name}' in '{obj_name}'")
+                continue
+            self._gn_targets.append((obj, modifier, identifier))
+
+    def _resolve_node_groups(self) -> None:
+        """
+        Look up the score and number ring node groups and map their inputs once.
+        
+        The config object is replaced by the UI, so the lookups are keyed by the
+        configured names and only redone when those change.
+        """
+        material_names = self.config.material_names
+        group_names = self.config.node_group_names
+        key = (material_names, group_names)
+        if key == self._node_cache_key:
+            return
+        self._node_cache_key = key
+        
+        self._score_seed_inputs = []
+        self._score_crack_inputs = []
+        self._score_hole_inputs = []
+        self._score_color_inputs = []
+        for mat_key, color_attr in _SCORE_MATERIALS:
+            material = bpy.data.materials.get(getattr(material_names, mat_key))
+            if not material or not material.use_nodes:
+                continue
+            
+            # Find any score texture node group in this material
+            node_tree = material.node_tree
+            group_node = find_node_group(node_tree, group_names.score_white_and_color)
+            if not group_node:
+                group_node = find_node_group(node_tree, group_names.score_black)
+            if group_node:
+                self._add_score_inputs(map_node_inputs(group_node), color_attr)
+        
+        self._digit_sockets = None
+        mat_name = material_names.number_ring
+        material = bpy.data.materials.get(mat_name)
+        if material and material.use_nodes:
+            group_name = group_names.digit_wear
+            group_node = find_node_group(material.node_tree, group_name)
+            if group_node:
+                self._digit_sockets = map_node_inputs(group_node)
+            else:
+                print(f"[DartboardRandomizer] Node Group '{group_name}' not found in {mat_name}")
+
     # -------------------------------------------------------------------------
     # PUBLIC API (BaseRandomizer Interface)
     # -------------------------------------------------------------------------
@@ -65,132 +183,107 @@ class DartboardRandomizer(BaseRandomizer):
         - All score texture materials
         - Number ring material
         """
+        self._resolve_node_groups()
+        
+        # One batch of uniforms for every scalar draw of this frame
+        (u_score_seed, u_crack, u_hole,
+         u_digit_seed, u_wear, u_contrast, u_wire_seed) = self.rng_np.random(7).tolist()
+        colors = self._get_randomized_colors()
+        
         # Randomize score materials
-        self._randomize_score_materials()
+        self._randomize_score_materials(colors, u_score_seed, u_crack, u_hole)
         
         # Randomize number ring material
-        self._randomize_number_ring_material()
+        self._randomize_number_ring_material(colors["digit_color"], u_digit_seed, u_wear, u_contrast)
         
         # Randomize Geometry Nodes (wire seeds)
-        self._randomize_geometry_nodes()
+        self._randomize_geometry_nodes(u_wire_seed)
 
     # -------------------------------------------------------------------------
     # SCORE MATERIALS
     # -------------------------------------------------------------------------
 
-    def _randomize_score_materials(self) -> None:
-        """Randomize all score texture materials."""
-        score_materials = [
-            ("score_red", "field_color_red"),
-            ("score_green", "field_color_green"),
-            ("score_white", "field_color_white"),
-            ("score_black", "field_color_black"),
-        ]
-        
-        # Generate shared values for all score materials so textures match across fields
-        shared_seed = self.rng.randint(0, 10000)
-        shared_crack_factor = self.config.crack_factor.get_value(self.rng) if self.config.randomize_cracks else None
-        shared_hole_factor = self.config.hole_factor.get_value(self.rng) if self.config.randomize_holes else None
-        
-        for mat_key, color_attr in score_materials:
-            mat_name = self.config.material_names.get(mat_key)
-            if not mat_name or mat_name not in bpy.data.materials:
-                continue
-            
-            material = bpy.data.materials[mat_name]
-            color_config = getattr(self.config, color_attr)
-            self._randomize_score_material(
-                material, color_config,
-                shared_seed, shared_crack_factor, shared_hole_factor
-            )
-
-    def _randomize_score_material(
-        self, 
-        material, 
-        color_config: ColorVariation,
-        seed: int,
-        crack_factor: Optional[float],
-        hole_factor: Optional[float]
+    def _randomize_score_materials(
+        self,
+        colors: Dict[str, Tuple[float, float, float, float]],
+        u_seed: float,
+        u_crack: float,
+        u_hole: float
     ) -> None:
-        """
-        Randomize a single score material.
+        """Randomize all score texture materials from pre-drawn uniform samples."""
+        cfg = self.config
         
-        Args:
-            material: The material to randomize
-            color_config: Color configuration for this material
-            seed: Shared seed for consistent textures across all score materials
-            crack_factor: Shared crack factor value (None if not randomizing)
-            hole_factor: Shared hole factor value (None if not randomizing)
-        """
-        if not material.use_nodes:
-            return
+        # Generate shared values for all score materials so textures match across fields
+        shared_seed = _to_seed(u_seed)
+        shared_crack_factor = cfg.crack_factor.value_at(u_crack) if cfg.randomize_cracks else None
+        shared_hole_factor = cfg.hole_factor.value_at(u_hole) if cfg.randomize_holes else None
         
-        node_tree = material.node_tree
+        for inp in self._score_seed_inputs:
+            inp.default_value = shared_seed
         
-        # Find any score texture node group in this material
-        group_node = find_node_group(node_tree, self.config.node_group_names["score_white_and_color"])
-        if not group_node:
-            group_node = find_node_group(node_tree, self.config.node_group_names["score_black"])
-        if not group_node:
-            return
+        if shared_crack_factor is not None:
+            for inp in self._score_crack_inputs:
+                inp.default_value = shared_crack_factor
         
-        # Set shared seed for consistent textures across all fields
-        set_node_input(group_node, "Seed", seed)
+        if shared_hole_factor is not None:
+            for inp in self._score_hole_inputs:
+                inp.default_value = shared_hole_factor
         
-        # Crack Factor (shared across all materials)
-        if crack_factor is not None:
-            set_node_input(group_node, "Crack_factor", crack_factor)
+        # Field Color - with optional variation based on its ColorVariation.randomize
+        for inp, color_attr in self._score_color_inputs:
+            inp.default_value = colors[color_attr]
+
+    def _add_score_inputs(self, sockets: Dict[str, bpy.types.NodeSocket], color_attr: str) -> None:
+        """Register the inputs of one score texture node group that are written per frame."""
+        for name, inputs in (
+            ("Seed", self._score_seed_inputs),
+            ("Crack_factor", self._score_crack_inputs),
+            ("Hole_factor", self._score_hole_inputs),
+        ):
+            inp = find_mapped_input(sockets, name)
+            if inp is not None:
+                inputs.append(inp)
         
-        # Hole Factor (shared across all materials)
-        if hole_factor is not None:
-            set_node_input(group_node, "Hole_factor", hole_factor)
-         
-        # Field Color - set with optional variation based on color_config.randomize
-        color = self._get_randomized_color(color_config)
-        set_node_input(group_node, "Field_color", color)
+        inp = find_mapped_input(sockets, "Field_color")
+        if inp is not None:
+            self._score_color_inputs.append((inp, color_attr))
 
     # -------------------------------------------------------------------------
     # NUMBER RING MATERIAL
     # -------------------------------------------------------------------------
 
-    def _randomize_number_ring_material(self) -> None:
-        """Randomize the number ring material (digit wear)."""
-        mat_name = self.config.material_names.get("number_ring")
-        if not mat_name or mat_name not in bpy.data.materials:
-            return
-        
-        material = bpy.data.materials[mat_name]
-        if not material.use_nodes:
-            return
-        
-        node_tree = material.node_tree
-        group_name = self.config.node_group_names["digit_wear"]
-        group_node = find_node_group(node_tree, group_name)
-        
-        if not group_node:
-            print(f"[DartboardRandomizer] Node Group '{group_name}' not found in {mat_name}")
+    def _randomize_number_ring_material(
+        self,
+        color: Tuple[float, float, float, float],
+        u_seed: float,
+        u_wear: float,
+        u_contrast: float
+    ) -> None:
+        """Randomize the number ring material (digit wear and the given digit color)."""
+        sockets = self._digit_sockets
+        if not sockets:
             return
         
         # Set seed
-        set_node_input(group_node, "Seed", self.rng.randint(0, 10000))
+        set_mapped_input(sockets, "Seed", _to_seed(u_seed))
         
         # Wear Level
-        if self.config.randomize_wear:
-            wear_val = self.config.wear_level.get_value(self.rng)
-            set_node_input(group_node, "Wear_level", wear_val)
+        cfg = self.config
+        if cfg.randomize_wear:
+            wear_val = cfg.wear_level.value_at(u_wear)
+            set_mapped_input(sockets, "Wear_level", wear_val)
             
-            contrast_val = self.config.wear_contrast.get_value(self.rng)
-            set_node_input(group_node, "Wear_contrast", contrast_val)
+            contrast_val = cfg.wear_contrast.value_at(u_contrast)
+            set_mapped_input(sockets, "Wear_contrast", contrast_val)
         
-        # Digit Color - set with optional variation based on digit_color.randomize
-        color = self._get_randomized_color(self.config.digit_color)
-        set_node_input(group_node, "Digit_color", color)
+        # Digit Color - with optional variation based on digit_color.randomize
+        set_mapped_input(sockets, "Digit_color", color)
 
     # -------------------------------------------------------------------------
     # GEOMETRY NODES
     # -------------------------------------------------------------------------
 
-    def _randomize_geometry_nodes(self) -> None:
+    def _randomize_geometry_nodes(self, u_seed: float) -> None:
         """
         Randomize Geometry Nodes modifiers.
         
@@ -198,48 +291,81 @@ class DartboardRandomizer(BaseRandomizer):
         Uses a shared seed for consistent wire appearance across all modifiers.
         """
         # Generate a shared seed for consistent wire appearance
-        wire_seed = self.rng.randint(0, 10000)
+        wire_seed = _to_seed(u_seed)
         
-        # Iterate over all configured geometry node modifiers
-        for obj_name, modifier_name in self.config.geometry_node_modifiers.items():
-            obj = bpy.data.objects.get(obj_name)
-            if not obj:
-                print(f"[DartboardRandomizer] Object '{obj_name}' not found")
-                continue
-            
-            success = set_geometry_node_input(obj, modifier_name, "Seed", wire_seed)
-            if not success:
-                print(f"[DartboardRandomizer] Could not set Seed on '{modifier_name}' in '{obj_name}'")
+        # Iterate over all configured geometry node modifiers (objects resolved once)
+        self._resolve_geometry_targets()
+        for obj, modifier, identifier in self._gn_targets:
+            try:
+                modifier[identifier] = wire_seed
+            except TypeError:
+                print(f"[DartboardRandomizer] Could not set Seed on '{modifier.name}' in '{obj.name}'")
             else:
                 # Force update of the object to ensure Geometry Nodes re-evaluate
                 obj.update_tag()
         
-        # Force dependency graph update to ensure geometry is recalculated
-        # This is sometimes needed for Geometry Nodes to reflect changes immediately
-        #if bpy.context.view_layer:
-        #    bpy.context.view_layer.update()
+        # No view_layer.update() here: the tags are enough, and the depsgraph is
+        # evaluated once per frame by the render / AnnotationManager.annotate()
+        # after all randomizers have run.
 
     # -------------------------------------------------------------------------
     # HELPER METHODS
     # -------------------------------------------------------------------------
 
-    def _get_randomized_color(self, config: ColorVariation) -> Tuple[float, float, float, float]:
+    def _get_randomized_colors(self) -> Dict[str, Tuple[float, float, float, float]]:
         """
-        Generate a randomized color based on the configuration.
+        Generate all dartboard colors for this frame in vectorized passes.
         
-        Args:
-            config: The color configuration
-            
         Returns:
-            RGBA tuple with the randomized color
+            Dict of config attribute name (e.g. "field_color_red") -> RGBA tuple.
+            Colors with randomize disabled (or zero variation) keep their exact base color.
         """
-        if not config.randomize:
-            return config.base_color
-        
-        return randomize_color_hsv(
-            config.base_color,
-            self.rng,
-            hue_variation=config.hue_variation,
-            saturation_variation=config.saturation_variation,
-            value_variation=config.value_variation
-        )
+        if self._colors_config is not self.config:
+            self._prepare_colors()
+        
+        # Fast path: nothing to jitter, the static colors are the result
+        if not self._jitter_attrs and not self._value_attrs:
+            return self._static_colors
+        
+        colors = dict(self._static_colors)
+        if self._jitter_attrs:
+            jittered = randomize_colors_hsv(self._base_colors, self._color_variations, self.rng_np)
+            colors.update(zip(self._jitter_attrs, map(tuple, jittered.tolist())))
+        if self._value_attrs:
+            jittered = randomize_colors_value(self._value_base_colors, self._value_variations, self.rng_np)
+            colors.update(zip(self._value_attrs, map(tuple, jittered.tolist())))
+        return colors
+    
+    def _prepare_colors(self) -> None:
+        """
+        Split the configured colors by the work they need per frame:
+        static (no randomization or all variations zero), value-only jitter
+        (plain RGB scaling) and full HSV jitter.
+        """
+        self._colors_config = self.config
+        configs = {attr: getattr(self.config, attr) for attr in _COLOR_ATTRS}
+        
+        static, value_only, full = [], [], []
+        for attr, c in configs.items():
+            if not c.randomize or max(c.hue_variation, c.saturation_variation, c.value_variation) <= 0:
+                static.append(attr)
+            elif c.hue_variation <= 0 and c.saturation_variation <= 0:
+                value_only.append(attr)
+            else:
+                full.append(attr)
+        
+        self._static_colors = {attr: configs[attr].base_color for attr in static}
+        
+        self._value_attrs = tuple(value_only)
+        self._value_base_colors = np.array(
+            [configs[attr].base_color for attr in value_only], dtype=np.float64
+        ).reshape(-1, 4)
+        self._value_variations = np.array([configs[attr].value_variation for attr in value_only], dtype=np.float64)
+        
+        self._jitter_attrs = tuple(full)
+        jittered = [configs[attr] for attr in full]
+        self._base_colors = np.array([c.base_color for c in jittered], dtype=np.float64).reshape(-1, 4)
+        self._color_variations = np.array(
+            [(c.hue_variation, c.saturation_variation, c.value_variation) for c in jittered],
+            dtype=np.float64
+        ).reshape(-1, 3)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneRandomConfig:
     """Configuration for scene randomization parameters."""
     
@@ -1,11 +1,18 @@
+import os
+import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple, Optional
 import bpy
 import math
 
 from randomizers.base_randomizer import BaseRandomizer
 from .scene_config import SceneRandomConfig
 
+logger = logging.getLogger(__name__)
+
+# Mapping X rotation that turns Generated coordinates into an upright equirectangular HDRI
+_RAD_90 = math.radians(90)
+
 
 class SceneRandomizer(BaseRandomizer):
     """
@@ -16,9 +23,24 @@ class SceneRandomizer(BaseRandomizer):
     for efficiency.
     """
 
+    __slots__ = (
+        "base_path", "hdri_images", "_hdri_keys",
+        "_hdri_world", "_env_tex", "_mapping_rot", "_bg_strength",
+        "_hdri_setup_world",
+    )
+
     def __init__(self, seed: int, config: SceneRandomConfig, base_path: Path = None):
         self.base_path = base_path or Path.cwd()
         self.hdri_images: Dict[str, bpy.types.Image] = {}
+        # Snapshot of the HDRI names for constant-time selection per frame
+        self._hdri_keys: Tuple[str, ...] = ()
+        # World whose HDRI nodes/sockets are cached below (None = not resolved yet)
+        self._hdri_world: Optional[bpy.types.World] = None
+        self._env_tex: Optional[bpy.types.Node] = None
+        self._mapping_rot: Optional[bpy.types.NodeSocket] = None
+        self._bg_strength: Optional[bpy.types.NodeSocket] = None
+        # World whose HDRI node setup is known to exist, so repeated calls return at once
+        self._hdri_setup_world: Optional[bpy.types.World] = None
         super().__init__(seed, config)
 
     # ---------------------------------------------------------------------
@@ -42,8 +64,12 @@ class SceneRandomizer(BaseRandomizer):
             print(f"Warning: HDRI folder not found at {hdri_path}")
             return
         
-        # Find all HDR/EXR files
-        hdri_files = list(hdri_path.glob("*.exr")) + list(hdri_path.glob("*.hdr"))
+        # Find all HDR/EXR files in a single directory pass (sorted for a stable selection order)
+        with os.scandir(hdri_path) as it:
+            hdri_files = sorted(
+                (entry for entry in it if entry.name.lower().endswith((".exr", ".hdr"))),
+                key=lambda entry: entry.name
+            )
         
         if not hdri_files:
             print(f"Warning: No HDRI files found in {hdri_path}")
@@ -54,23 +80,24 @@ class SceneRandomizer(BaseRandomizer):
         # Load/Link HDRIs safely
         for hdri_file in hdri_files:
             try:
-                # Check if image already exists
-                if hdri_file.name in bpy.data.images:
-                    img = bpy.data.images[hdri_file.name]
-                    img.reload()
-                else:
+                # Reuse an already loaded image as is; reloading large HDRIs from disk
+                # on every startup is the expensive part of initialization
+                img = bpy.data.images.get(hdri_file.name)
+                if img is None:
                     # Load new image
-                    img = bpy.data.images.load(str(hdri_file), check_existing=True)
+                    img = bpy.data.images.load(hdri_file.path, check_existing=True)
                 
-                print(f"  - Loaded: {hdri_file.name}")
+                logger.debug(f"  - Loaded: {hdri_file.name}")
                 
                 # Ensure image persists in memory
-                img.use_fake_user = True
+                if not img.use_fake_user:
+                    img.use_fake_user = True
                 self.hdri_images[hdri_file.name] = img
                 
             except Exception as e:
-                print(f"  - Failed to load {hdri_file.name}: {e}")
+                logger.warning(f"  - Failed to load {hdri_file.name}: {e}")
         
+        self._hdri_keys = tuple(self.hdri_images)
         print(f"Successfully loaded {len(self.hdri_images)} HDRIs")
 
     def _ensure_hdri_node_setup(self, scene):
@@ -78,6 +105,9 @@ class SceneRandomizer(BaseRandomizer):
         Ensure that the world node setup for HDRI environment mapping exists.
         """
         world = scene.world
+        if world is not None and world == self._hdri_setup_world:
+            return
+
         if world is None:
             world = bpy.data.worlds.new("World")
             scene.world = world
@@ -88,6 +118,7 @@ class SceneRandomizer(BaseRandomizer):
 
         # Check if setup already exists
         if "ENV_TEX" in nodes:
+            self._hdri_setup_world = world
             return  # Setup exists → do nothing
 
         # Clear setup
@@ -101,7 +132,7 @@ class SceneRandomizer(BaseRandomizer):
         mapping = nodes.new("ShaderNodeMapping")
         mapping.name = "MAPPING"
         mapping.location = (-600, 300)
-        mapping.inputs["Rotation"].default_value[0] = math.radians(90)
+        mapping.inputs["Rotation"].default_value[0] = _RAD_90
 
         env_tex = nodes.new("ShaderNodeTexEnvironment")
         env_tex.name = "ENV_TEX"
@@ -121,9 +152,28 @@ class SceneRandomizer(BaseRandomizer):
         links.new(env_tex.outputs["Color"], background.inputs["Color"])
         links.new(background.outputs["Background"], output.inputs["Surface"])
 
+        self._hdri_setup_world = world
         print("World HDRI nodes initialized")
 
 
+    def _cache_hdri_nodes(self, world: Optional[bpy.types.World]) -> None:
+        """
+        Resolve the HDRI nodes and the sockets written per frame for the given world.
+        Leaves the cache empty if the world has no complete HDRI setup.
+        """
+        self._hdri_world = world
+        self._env_tex = self._mapping_rot = self._bg_strength = None
+        if not world or not world.node_tree:
+            return
+
+        nodes = world.node_tree.nodes
+        if "ENV_TEX" not in nodes or "MAPPING" not in nodes or "BG" not in nodes:
+            return
+
+        self._env_tex = nodes["ENV_TEX"]
+        self._mapping_rot = nodes["MAPPING"].inputs["Rotation"]
+        self._bg_strength = nodes["BG"].inputs["Strength"]
+
     # ---------------------------------------------------------------------
     # PUBLIC API
     # ---------------------------------------------------------------------
@@ -152,21 +202,21 @@ class SceneRandomizer(BaseRandomizer):
 
         # self._ensure_hdri_node_setup(scene) # Removed to avoid node tree modification during render
         world = scene.world
-        if not world or not world.node_tree:
-            return
+        if self._env_tex is None or world != self._hdri_world:
+            self._cache_hdri_nodes(world)
 
-        nodes = world.node_tree.nodes
-        
-        if "ENV_TEX" not in nodes or "MAPPING" not in nodes or "BG" not in nodes:
+        env_tex = self._env_tex
+        if env_tex is None:
             # print("HDRI nodes missing, skipping randomization")
             return
 
-        env_tex = nodes["ENV_TEX"]
-        mapping = nodes["MAPPING"]
-        background = nodes["BG"]
+        rng = self.rng
+        cfg = self.config
 
         # HDRI auswählen
-        hdri_key = self.rng.choice(list(self.hdri_images.keys()))
+        # randrange draws the same index as rng.choice, without building a key list
+        hdri_keys = self._hdri_keys
+        hdri_key = hdri_keys[rng.randrange(len(hdri_keys))]
         new_image = self.hdri_images[hdri_key]
         
         # Verify image is valid
@@ -186,18 +236,12 @@ class SceneRandomizer(BaseRandomizer):
             env_tex.image = new_image
 
         # Rotation
-        rotation_z = self.rng.uniform(
-            self.config.hdri_rotation_min,
-            self.config.hdri_rotation_max
-        )
-        mapping.inputs["Rotation"].default_value[2] = rotation_z
+        rotation_z = rng.uniform(cfg.hdri_rotation_min, cfg.hdri_rotation_max)
+        self._mapping_rot.default_value[2] = rotation_z
 
         # Strength
-        strength = self.rng.uniform(
-            self.config.hdri_strength_min,
-            self.config.hdri_strength_max
-        )
-        background.inputs["Strength"].default_value = strength
+        strength = rng.uniform(cfg.hdri_strength_min, cfg.hdri_strength_max)
+        self._bg_strength.default_value = strength
 
         # print(f"Applied HDRI: {image_name}, rot={rotation_z:.2f}, str={strength:.2f}")
 
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class ThrowRandomConfig:
     """
     Configuration for dart throwing randomization.
@@ -1,7 +1,8 @@
 import bpy
 import math
-from typing import Optional, List
-from mathutils import Vector, Euler
+from typing import Dict, Optional, List, Tuple
+from mathutils import Vector
+import numpy as np
 
 from randomizers.base_randomizer import BaseRandomizer
 from .throw_config import ThrowRandomConfig
@@ -27,6 +28,21 @@ class ThrowRandomizer(BaseRandomizer):
         self.template_k_name = "Dart_K"
         self.collection_name = "Generated_Darts"
         self.collection = None
+
+        # Template objects resolved once; _templates_hidden is reset whenever they are re-resolved
+        self._template_dart: Optional[bpy.types.Object] = None
+        self._template_k: Optional[bpy.types.Object] = None
+        self._templates_hidden = False
+        # Flattened template hierarchy (see _flatten_hierarchy), reused for every spawn
+        self._template_flat: Optional[List[Tuple[Optional[int], bpy.types.Object]]] = None
+
+        # Number of darts in use; spawned_darts beyond this are hidden and kept for reuse
+        self._active_count = 0
+
+        # Per-column sampling bounds for _sample_transforms, derived from this config object
+        self._transform_bounds_config: Optional[ThrowRandomConfig] = None
+        self._transform_lows: Optional[np.ndarray] = None
+        self._transform_highs: Optional[np.ndarray] = None
         
         # Initialize Dartboard Layout
         self.board_layout = DartboardLayout()
@@ -42,12 +58,13 @@ class ThrowRandomizer(BaseRandomizer):
         self._ensure_collection()
         self._clear_existing_darts()
         self._spawn_dart_pool()
+        self._active_count = len(self.spawned_darts)
 
     def _ensure_collection(self):
         """Ensure the collection for generated darts exists."""
-        if self.collection_name in bpy.data.collections:
-            self.collection = bpy.data.collections[self.collection_name]
-        else:
+        # Single name lookup; the ID reference is kept in self.collection from here on
+        self.collection = bpy.data.collections.get(self.collection_name)
+        if self.collection is None:
             self.collection = bpy.data.collections.new(self.collection_name)
             bpy.context.scene.collection.children.link(self.collection)
 
@@ -59,39 +76,56 @@ class ThrowRandomizer(BaseRandomizer):
         # Collect all objects in the collection
         # Since we link all parts of the hierarchy to the collection, 
         # iterating collection.objects is sufficient.
-        objects_to_delete = [obj for obj in self.collection.objects]
+        objects_to_delete = tuple(self.collection.objects)
         
-        # Use low-level remove to ensure deletion without selection context issues
-        for obj in objects_to_delete:
+        # Remove everything in one batch: a single ID-user/DepsGraph update instead of one per
+        # object, and no selection context needed (unlike bpy.ops.object.delete)
+        if objects_to_delete:
             try:
-                bpy.data.objects.remove(obj, do_unlink=True)
+                bpy.data.batch_remove(objects_to_delete)
             except Exception as e:
-                print(f"[ThrowRandomizer] Error removing object {obj.name}: {e}")
+                print(f"[ThrowRandomizer] Error removing {len(objects_to_delete)} objects: {e}")
             
         self.spawned_darts.clear()
         self.spawned_k_points.clear()
+        self._active_count = 0
+
+    def _spawn_dart_pool(self, count: Optional[int] = None) -> None:
+        """
+        Spawn darts into the pool.
+
+        Args:
+            count: Number of darts to add. Defaults to the configured number of darts.
+        """
+        if count is None:
+            count = self.config.num_darts
 
-    def _spawn_dart_pool(self) -> None:
-        """Spawn the configured number of darts into the pool."""
-        template_dart = bpy.data.objects.get(self.template_dart_name)
+        template_dart, template_k = self._resolve_templates()
         if not template_dart:
-            print(f"[ThrowRandomizer] Template dart '{self.template_dart_name}' not found!")
             return
-        
-        # Debug: Check constraints
-        if template_dart.constraints:
-            print(f"[ThrowRandomizer] Template Dart '{template_dart.name}' has constraints: {[c.name for c in template_dart.constraints]}")
-            
-        template_k = bpy.data.objects.get(self.template_k_name)
-        if not template_k:
-            print(f"[ThrowRandomizer] Template K-Point '{self.template_k_name}' not found!")
 
         # Determine if we should use linked duplicates (shared data/materials)
         use_linked = self.config.same_appearance
 
-        for i in range(self.config.num_darts):
+        # Walk the template hierarchy once and reuse it for later spawns, unless parts of it were deleted
+        template_flat = self._template_flat
+        if template_flat is None or not all(self._is_alive(obj) for _, obj in template_flat):
+            template_flat = self._template_flat = self._flatten_hierarchy(template_dart)
+
+        # Distinct template materials (in slot order), each copied once per dart below
+        template_materials: List[bpy.types.Material] = []
+        if not use_linked:
+            template_materials = list(dict.fromkeys(
+                slot.material
+                for _, obj in template_flat
+                for slot in obj.material_slots
+                if slot.material
+            ))
+
+        for i in range(count):
             # 1. Spawn Dart
-            new_dart_root = self._duplicate_hierarchy(template_dart, linked=use_linked)
+            material_copies = {mat: mat.copy() for mat in template_materials}
+            new_dart_root = self._duplicate_hierarchy(template_flat, linked=use_linked, material_copies=material_copies)
             if new_dart_root:
                 # Clear constraints on the root to allow free movement (e.g. if template was constrained to center)
                 new_dart_root.constraints.clear()
@@ -120,123 +154,232 @@ class ThrowRandomizer(BaseRandomizer):
                 if new_dart_root and self.spawned_darts:
                     self.spawned_darts[-1].k_point = new_k
         
-        # Ensure template collection is hidden if possible
-        if template_dart.users_collection:
+        if not self._templates_hidden:
+            # Ensure template collection is hidden if possible
             for coll in template_dart.users_collection:
                 coll.hide_viewport = True
                 coll.hide_render = True
-        
-        # Hide template K
-        if template_k:
-            template_k.hide_viewport = True
-            template_k.hide_render = True
+            
+            # Hide template K
+            if template_k:
+                template_k.hide_viewport = True
+                template_k.hide_render = True
+            self._templates_hidden = True
+
+        # Evaluate the DepsGraph once for the whole pool instead of lazily per access
+        bpy.context.view_layer.update()
+
+    def _resolve_templates(self) -> Tuple[Optional[bpy.types.Object], Optional[bpy.types.Object]]:
+        """
+        Return the template dart and K-Point, looking them up in bpy.data only when
+        the cached references are missing or were deleted.
+        """
+        if self._is_alive(self._template_dart) and (self._template_k is None or self._is_alive(self._template_k)):
+            return self._template_dart, self._template_k
+
+        self._templates_hidden = False
+        self._template_flat = None
+        self._template_dart = template_dart = bpy.data.objects.get(self.template_dart_name)
+        self._template_k = template_k = bpy.data.objects.get(self.template_k_name)
+
+        if not template_dart:
+            print(f"[ThrowRandomizer] Template dart '{self.template_dart_name}' not found!")
+            return None, template_k
+
+        # Debug: Check constraints
+        if template_dart.constraints:
+            print(f"[ThrowRandomizer] Template Dart '{template_dart.name}' has constraints: {[c.name for c in template_dart.constraints]}")
+
+        if not template_k:
+            print(f"[ThrowRandomizer] Template K-Point '{self.template_k_name}' not found!")
+
+        return template_dart, template_k
+
+    def _set_active_count(self, count: int) -> None:
+        """
+        Use the first `count` darts of the pool and hide the rest.
+
+        Surplus darts stay in the pool (hidden) so that a later increase of num_darts
+        reuses them instead of duplicating the template hierarchy again.
+        """
+        for dart in self.spawned_darts[count:self._active_count]:
+            dart.set_visibility(False)
+        self._active_count = count
 
     def randomize(self, *args, **kwargs) -> None:
         """
         Randomize the existing darts in the pool.
         """
-        # Safety check: if pool is empty or size mismatch (e.g. config changed), respawn
-        # Check if objects in spawned_darts are valid (not deleted)
-        self.spawned_darts = [d for d in self.spawned_darts if d is not None and d.root is not None]
-        self.spawned_k_points = [k for k in self.spawned_k_points if k is not None]
-        
-        # Also check if they are actually in the scene/collection
-        # self.spawned_darts = [d for d in self.spawned_darts if not self.collection or d.root.name in self.collection.objects]
+        # Safety check: if pool is empty or too small (e.g. config changed), grow or respawn
+        # Check if objects in spawned_darts are valid (not deleted). Dead references are
+        # detected directly on the ID, no name lookups in the collection are needed.
+        # Stable pools (the common case) are only scanned; the lists are rebuilt only
+        # when something was actually deleted.
+        is_alive = self._is_alive
+        pool_intact = (
+            all(d is not None and is_alive(d.root) for d in self.spawned_darts)
+            and all(is_alive(k) for k in self.spawned_k_points)
+        )
+        if not pool_intact:
+            self.spawned_darts = [d for d in self.spawned_darts if d is not None and is_alive(d.root)]
+            self.spawned_k_points = [k for k in self.spawned_k_points if is_alive(k)]
 
-        if len(self.spawned_darts) != self.config.num_darts:
-             print(f"[ThrowRandomizer] Dart count mismatch ({len(self.spawned_darts)} != {self.config.num_darts}). Respawning pool.")
+        num_darts = self.config.num_darts
+        delta = num_darts - len(self.spawned_darts)
+        if delta > 0 and not pool_intact:
+             # Leftovers of deleted darts may still be in the collection: rebuild from scratch
+             print(f"[ThrowRandomizer] Dart count mismatch ({len(self.spawned_darts)} != {num_darts}). Respawning pool.")
              self._clear_existing_darts()
              self._spawn_dart_pool()
+             self._active_count = len(self.spawned_darts)
+        elif delta > 0:
+             # Pool too small: keep the existing darts and only add the missing ones
+             self._spawn_dart_pool(delta)
+             self._active_count = len(self.spawned_darts)
 
-        base_seed = self.rng.randint(0, 100000)
-        
-        for i, dart in enumerate(self.spawned_darts):
-            if not dart or not dart.root: continue
-            
-            # Reset visibility (in case it was hidden in previous frame)
-            dart.set_visibility(True)
+        # Surplus darts are hidden rather than removed, so shrinking and regrowing is free
+        if self._active_count != num_darts:
+             self._set_active_count(min(num_darts, len(self.spawned_darts)))
+        active_darts = self.spawned_darts[:self._active_count]
+
+        cfg = self.config
+        dart_randomizer = self.dart_randomizer
+        n = len(active_darts)
+
+        # Draw all dart transforms in one batch instead of 5 scalar RNG calls per dart
+        transforms = self._sample_transforms(n)
+
+        # Appearance seeds (one per dart plus the shared one, 0..100000 inclusive) and
+        # bouncer draws for the whole frame, also batched
+        rng_np = self.rng_np
+        dart_seeds = rng_np.integers(0, 100000, size=n + 1, endpoint=True).tolist()
+        base_seed = dart_seeds.pop()
+        bouncer_draws = rng_np.random(n)
+
+        # --- Visibility Logic (whole batch, from the sampled surface positions) ---
+        hide = np.zeros(n, dtype=bool)
+        # Rule 1: Outside board (board center is 0,0,0)
+        if not cfg.allow_darts_outside_board:
+            hide |= np.hypot(transforms[:, 0], transforms[:, 1]) > 0.225
+        # Rule 2: Bouncer
+        if cfg.bouncer_probability > 0:
+            hide |= bouncer_draws < cfg.bouncer_probability
+        visible = (~hide).tolist()
+
+        # --- Pass 1: Appearance (also samples each dart's tip length) ---
+        for i, dart in enumerate(active_darts):
+            # Set this frame's visibility once (also undoes hiding from the previous frame)
+            dart.set_visibility(visible[i])
             
             # Randomize Appearance
-            if self.dart_randomizer:
+            if dart_randomizer:
                 # Determine seed for this dart
-                if self.config.same_appearance:
+                if cfg.same_appearance:
                     dart_seed = base_seed
                 else:
-                    dart_seed = self.rng.randint(0, 100000)
-                
-                self.dart_randomizer.update_seed(dart_seed)
-                self.dart_randomizer.randomize(dart=dart)
-            
-            # Randomize Position/Rotation
-            self._randomize_transform(dart.root)
-            
-            # --- Visibility Logic ---
-            # Calculate radius from current location (assuming board center is 0,0,0)
-            current_radius = dart.root.location.xy.length
-            
-            should_hide = False
-            
-            # Rule 1: Outside board
-            if current_radius > 0.225 and not self.config.allow_darts_outside_board:
-                should_hide = True
-                # print(f"[ThrowRandomizer] Hiding {dart.root.name}: Radius {current_radius:.4f} > 0.225m")
+                    dart_seed = dart_seeds[i]
                 
-            # Rule 2: Bouncer (only if not already hidden)
-            if not should_hide and self.config.bouncer_probability > 0:
-                if self.rng.random() < self.config.bouncer_probability:
-                    should_hide = True
-                    # print(f"[ThrowRandomizer] Hiding {dart.root.name}: Bouncer (Prob: {self.config.bouncer_probability})")
-                    
-            if should_hide:
-                dart.set_visibility(False)
+                dart_randomizer.update_seed(dart_seed)
+                dart_randomizer.randomize(dart=dart)
+
+        # --- Pass 2: Embedding for all darts at once (one array per quantity) ---
+        locations = np.zeros((n, 3), dtype=np.float64)
+        locations[:, :2] = transforms[:, :2]
+        # Flat overlay configs (zero embed factors) skip the whole embedding step
+        embed_active = cfg.embed_depth_factor_min != 0.0 or cfg.embed_depth_factor_max != 0.0
+        if embed_active:
+            # Tip length in mm, cached on the wrapper by DartRandomizer; convert to meters for world space.
+            # 0.0 means it was never randomized: fall back to 30mm
+            tip_lengths_mm = np.fromiter((d.tip_length for d in active_darts), dtype=np.float64, count=n)
+            tip_lengths_mm[tip_lengths_mm == 0.0] = 30.0
+            # Only darts with a K-Point are embedded
+            has_k_point = np.fromiter((d.k_point is not None for d in active_darts), dtype=bool, count=n)
+            embed_depths = np.where(has_k_point, tip_lengths_mm / 1000.0 * transforms[:, 5], 0.0)
+
+            # Move Dart INTO the board: darts point along their local Z axis (+Z away from the board),
+            # so location += rotation @ (0, 0, -depth) = surface position - depth * (rotated local Z axis)
+            locations -= embed_depths[:, None] * transforms[:, 6:9]
+            embed_depths = embed_depths.tolist()
+
+        # --- Pass 3: Write transforms and K-Points ---
+        rows = transforms.tolist()
+        locations = locations.tolist()
+        for i, dart in enumerate(active_darts):
+            root = dart.root
+            x, y, rx, ry, rz = rows[i][:5]
+
+            # Slice assignment writes all components into the RNA array in one call,
+            # without building intermediate Vector/Euler objects.
+            # Rotation components are interpreted in the object's rotation mode, XYZ by default
+            root.rotation_euler[:] = (rx, ry, rz)
+            if root.rotation_mode == 'XYZ' or not embed_active:
+                root.location[:] = locations[i]
+            else:
+                # Other rotation orders: the closed form used for the batch does not apply
+                root.location[:] = (x, y, 0.0)
+                root.location += root.rotation_euler.to_matrix() @ Vector((0, 0, -embed_depths[i]))
             
-            # Handle K-Point and Embedding
-            if dart.k_point:
-                k_point = dart.k_point
-                # 1. Move K-Point to Dart's surface position
-                # IMPORTANT: We must copy the vector, otherwise it's a reference!
-                # But assigning vector to vector property in Blender usually copies values.
-                # Let's be explicit to be safe.
-                k_point.location = dart.root.location.copy()
-                k_point.rotation_euler = dart.root.rotation_euler.copy()
-                
-                # 2. Calculate Embedding Depth
-                # Get tip length from the dart instance (cached!)
-                # Value is in mm (from config/GeoNodes), convert to meters for world space transform
-                tip_length_mm = dart.tip_length
-                
-                # If reading failed (shouldn't happen if randomized), fallback
-                if tip_length_mm == 0.0:
-                    tip_length_mm = 30.0 # Fallback 30mm
-                
-                tip_length_m = tip_length_mm / 1000.0
-                
-                embed_factor = self.rng.uniform(self.config.embed_depth_factor_min, self.config.embed_depth_factor_max)
-                embed_depth_m = tip_length_m * embed_factor
-                
-                # 3. Move Dart INTO the board
-                # Assuming Dart points in local Z direction (or whatever direction the arrow points)
-                # If arrow points AWAY from board, then +Z is AWAY.
-                # To move INTO board, we need to move in -Z direction.
-                
-                # Calculate translation vector in local space
-                local_translation = Vector((0, 0, -embed_depth_m))
-                
-                # Apply to world location
-                # location += rotation @ local_translation
-                dart.root.location += dart.root.rotation_euler.to_matrix() @ local_translation
+            # Move K-Point to Dart's surface position (z = 0 on the board plane)
+            k_point = dart.k_point
+            if k_point:
+                k_point.location[:] = (x, y, 0.0)
+                k_point.rotation_euler[:] = (rx, ry, rz)
+
+    @staticmethod
+    def _is_alive(obj: Optional[bpy.types.Object]) -> bool:
+        """Return False for None and for references to objects removed from bpy.data."""
+        if obj is None:
+            return False
+        try:
+            obj.name
+        except ReferenceError:
+            return False
+        return True
+
+    @staticmethod
+    def _flatten_hierarchy(root_obj: bpy.types.Object) -> List[Tuple[Optional[int], bpy.types.Object]]:
+        """
+        Flatten an object hierarchy into (parent_index, obj) pairs in depth-first order.
 
-    def _duplicate_hierarchy(self, root_obj: bpy.types.Object, linked: bool = False) -> bpy.types.Object:
+        Parents always precede their children, so the list can be copied front to back.
+        Object.children scans all objects in the file on every access; walking it once
+        per pool instead of once per duplicated dart keeps that cost out of the spawn loop.
+        """
+        flat: List[Tuple[Optional[int], bpy.types.Object]] = []
+        stack: List[Tuple[Optional[int], bpy.types.Object]] = [(None, root_obj)]
+        while stack:
+            parent_index, obj = stack.pop()
+            index = len(flat)
+            flat.append((parent_index, obj))
+            # Reversed so children are popped (and copied) in their original order
+            stack.extend((index, child) for child in reversed(obj.children))
+        return flat
+
+    def _duplicate_hierarchy(
+        self,
+        template_flat: List[Tuple[Optional[int], bpy.types.Object]],
+        linked: bool = False,
+        material_copies: Optional[Dict[bpy.types.Material, bpy.types.Material]] = None,
+    ) -> Optional[bpy.types.Object]:
         """
         Duplicate an object hierarchy using low-level API.
         
         Args:
-            root_obj: The root object to duplicate.
+            template_flat: The hierarchy to duplicate, as returned by _flatten_hierarchy.
             linked: If True, shares Mesh data and Materials (Linked Duplicate). 
-                    If False, creates deep copies of Data and Materials.
+                    If False, still shares the (never modified) object data, but gives the
+                    duplicate its own copies of the Materials via object-linked slots.
+            material_copies: Pre-made copies of the template materials for this duplicate
+                    (template material -> copy). Materials missing here are copied on the fly.
         """
-        
-        def copy_recursive(obj, parent_new_obj=None):
+        if material_copies is None:
+            material_copies = {}
+        # New objects are linked to the collection after the whole hierarchy is copied,
+        # so the copy/parent steps don't interleave with collection (DepsGraph) updates
+        new_objects: List[bpy.types.Object] = []
+        append = new_objects.append
+
+        for parent_index, obj in template_flat:
             # Copy object wrapper (always needed for separate transform/modifiers)
             new_obj = obj.copy()
             
@@ -245,66 +388,76 @@ class ThrowRandomizer(BaseRandomizer):
             new_obj.hide_viewport = False
             
             if not linked:
-                # Deep copy data (mesh, curve, etc.)
-                if obj.data:
-                    new_obj.data = obj.data.copy()
-                
-                # Deep copy materials
-                if hasattr(new_obj, "material_slots"):
-                    for i, slot in enumerate(new_obj.material_slots):
-                        if slot.material:
-                            new_mat = slot.material.copy()
-                            slot.material = new_mat
+                # Object data (mesh, curve, etc.) is only shaped by the per-object Geometry Nodes
+                # modifiers and never written to, so it stays shared instead of being copied.
+                # Only the materials are mutated per dart: link the slots to the object so the
+                # copies below don't leak into the shared data's slots.
+                # (every Object has material_slots, empty for empties)
+                for slot in new_obj.material_slots:
+                    material = slot.material
+                    if material:
+                        new_mat = material_copies.get(material)
+                        if new_mat is None:
+                            new_mat = material_copies[material] = material.copy()
+                        slot.link = 'OBJECT'
+                        slot.material = new_mat
             # If linked=True, we keep the references to original data and materials
             # This saves memory and ensures they look identical
 
-            # Link to new collection
-            if self.collection:
-                self.collection.objects.link(new_obj)
-            
-            # Parent to new parent
-            if parent_new_obj:
-                new_obj.parent = parent_new_obj
+            # Parent to new parent (copied earlier, since parents precede children)
+            if parent_index is not None:
+                new_obj.parent = new_objects[parent_index]
                 # Maintain offset
                 new_obj.matrix_parent_inverse = obj.matrix_parent_inverse.copy()
 
-            # Process children
-            for child in obj.children:
-                copy_recursive(child, new_obj)
-            
-            return new_obj
+            append(new_obj)
 
-        new_root = copy_recursive(root_obj)
-        return new_root
+        # Link to new collection
+        if self.collection:
+            link = self.collection.objects.link
+            for new_obj in new_objects:
+                link(new_obj)
 
-    def _randomize_transform(self, obj: bpy.types.Object) -> None:
-        """Apply random position and rotation."""
-        # Position (Polar Coordinates)
-        angle = self.rng.random() * 2 * math.pi
-        radius = self.rng.random() * self.config.max_radius
-        
-        # Validate radius using DartboardLayout
-        radius = self.board_layout.validate_radius(radius)
-        
-        # Validate angle using DartboardLayout
-        angle = self.board_layout.validate_angle(radius, angle)
-        
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        z = 0 # Assuming board plane is at Z=0
-        
-        # Debug
-        # print(f"[ThrowRandomizer] {obj.name}: Radius={radius:.4f}, Angle={angle:.4f} -> ({x:.4f}, {y:.4f}, {z:.4f})")
-        
-        obj.location = Vector((x, y, z))
-        
-        # Debug: Check if location assignment worked (constraints might override it)
-        if (obj.location - Vector((x, y, z))).length > 0.001:
-             print(f"[ThrowRandomizer] Warning: Location assignment failed for {obj.name}! Wanted {Vector((x,y,z))}, got {obj.location}. Check for constraints.")
-
-        # Rotation
-        rx = math.radians(self.config.rot_x_min + self.rng.random() * (self.config.rot_x_max - self.config.rot_x_min))
-        ry = math.radians(self.config.rot_y_min + self.rng.random() * (self.config.rot_y_max - self.config.rot_y_min))
-        rz = math.radians(self.config.rot_z_min + self.rng.random() * (self.config.rot_z_max - self.config.rot_z_min))
-        
-        obj.rotation_euler = Euler((rx, ry, rz), 'XYZ')
+        return new_objects[0] if new_objects else None
+
+    def _sample_transforms(self, n: int) -> np.ndarray:
+        """
+        Sample the raw transforms of n darts in one NumPy call.
+
+        Returns an (n, 9) array, one row per dart: (x, y, rx, ry, rz, embed_factor, zx, zy, zz),
+        with the board position already moved off the wires and angles in radians.
+        (zx, zy, zz) is the local Z axis rotated by the XYZ Euler (rx, ry, rz), i.e. the
+        third column of Rz @ Ry @ Rx, used to embed the dart along its own axis.
+        """
+        cfg = self.config
+        if cfg is not self._transform_bounds_config:
+            self._transform_lows = np.array(
+                (0.0, 0.0, cfg.rot_x_min, cfg.rot_y_min, cfg.rot_z_min, cfg.embed_depth_factor_min),
+                dtype=np.float64
+            )
+            self._transform_highs = np.array(
+                (2 * math.pi, cfg.max_radius, cfg.rot_x_max, cfg.rot_y_max, cfg.rot_z_max, cfg.embed_depth_factor_max),
+                dtype=np.float64
+            )
+            self._transform_bounds_config = cfg
+
+        # All random columns come from one uniform() call writing into the output block;
+        # the axis columns are then derived in place, without further temporaries per column
+        samples = np.empty((n, 9), dtype=np.float64)
+        samples[:, :6] = self.rng_np.uniform(self._transform_lows, self._transform_highs, size=(n, 6))
+        rot = samples[:, 2:5]
+        np.deg2rad(rot, out=rot)
+
+        # Position (polar coordinates): validate against the wires, then convert for all darts at once
+        radius, angle = self.board_layout.validate_polar_arrays(samples[:, 1], samples[:, 0])
+        samples[:, 0] = radius * np.cos(angle)
+        samples[:, 1] = radius * np.sin(angle)
+
+        # Rotated Z axis for all darts at once
+        sin_x, sin_y, sin_z = np.sin(rot.T)
+        cos_x, cos_y, cos_z = np.cos(rot.T)
+        samples[:, 6] = cos_z * sin_y * cos_x + sin_z * sin_x
+        samples[:, 7] = sin_z * sin_y * cos_x - cos_z * sin_x
+        samples[:, 8] = cos_y * cos_x
+
+        return samples
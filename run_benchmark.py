@@ -1,4 +1,5 @@
 import subprocess
+import tempfile
 import time
 import os
 import sys
@@ -8,6 +9,10 @@ import sys
 # Anzahl der parallelen Blender-Instanzen
 NUM_INSTANCES = 4
 
+# Render-Threads pro Instanz: die Kerne werden auf die Instanzen aufgeteilt,
+# damit sich die parallelen Blender-Prozesse nicht gegenseitig ausbremsen
+THREADS_PER_INSTANCE = max(1, (os.cpu_count() or 1) // NUM_INSTANCES)
+
 # Pfade (Nutze r"..." Strings für Windows-Pfade, damit Backslashes kein Problem sind)
 BLENDER_EXE = r"C:\Program Files\Blender Foundation\Blender 4.5\blender.exe"
 PROJECT_DIR = r"C:\Users\Tim\OneDrive - TH Köln\03_Hochschule\7_Semester\Bachelorarbeit\source\blender-dart-dataset-generator"
@@ -23,16 +28,18 @@ def main():
         return
 
     # Der Befehl als Liste (Subprocess mag Listen lieber als lange Strings mit Leerzeichen)
-    # Entspricht: blender.exe -b datei.blend -P skript.py -a
+    # Entspricht: blender.exe -b datei.blend -t N -P skript.py -a
     command = [
         BLENDER_EXE,
         "-b", BLEND_FILE,
+        "-t", str(THREADS_PER_INSTANCE),
         "-P", PYTHON_SCRIPT,
         "-a"
     ]
 
     print(f"--- Starte Benchmark mit {NUM_INSTANCES} Instanzen ---")
     print(f"Projekt: {PROJECT_DIR}")
+    print(f"Threads pro Instanz: {THREADS_PER_INSTANCE}")
     print("Drücke STRG+C, um abzubrechen (es dauert einen Moment, bis alle Prozesse stoppen).")
     print("-" * 60)
 
@@ -40,6 +47,9 @@ def main():
     start_time = time.perf_counter()
     
     processes = []
+    # stderr je Instanz in eine temporäre Datei (eine PIPE könnte volllaufen und Blender blockieren)
+    error_logs = []
+    failed = []
 
     try:
         # 1. Alle Prozesse starten (asynchron)
@@ -48,17 +58,36 @@ def main():
             
             # Popen startet den Prozess im Hintergrund.
             # cwd=PROJECT_DIR sorgt dafür, dass Blender im richtigen Ordner startet.
-            # stdout=subprocess.DEVNULL würde die Ausgabe unterdrücken (weniger Chaos),
-            # aber du willst evtl. sehen, ob Fehler passieren.
-            p = subprocess.Popen(command, cwd=PROJECT_DIR)
+            # stdout=subprocess.DEVNULL unterdrückt die Ausgabe: mehrere Prozesse, die gleichzeitig
+            # in dieselbe Konsole schreiben, bremsen sich sonst gegenseitig aus.
+            # Fehler landen in stderr und werden für fehlgeschlagene Instanzen ausgegeben.
+            log = tempfile.TemporaryFile()
+            p = subprocess.Popen(command, cwd=PROJECT_DIR, stdout=subprocess.DEVNULL, stderr=log)
             processes.append(p)
+            error_logs.append(log)
 
         print("-" * 60)
         print("Alle Instanzen laufen. Warte auf Fertigstellung...")
 
-        # 2. Warten, bis alle Prozesse beendet sind
-        for p in processes:
-            p.wait()
+        # 2. Warten, bis alle Prozesse beendet sind (Polling, damit Fehler sofort auffallen,
+        #    egal welche Instanz zuerst abbricht)
+        running = dict(enumerate(processes))
+        while running:
+            for i, p in list(running.items()):
+                rc = p.poll()
+                if rc is None:
+                    continue
+                del running[i]
+                if rc != 0:
+                    failed.append(i)
+                    error_logs[i].seek(0)
+                    stderr = error_logs[i].read().decode(errors="replace")
+                    print(f"FEHLER: Instanz {i+1} beendet mit Code {rc}")
+                    if stderr:
+                        print(stderr)
+                else:
+                    print(f"Instanz {i+1} fertig.")
+            time.sleep(0.1)
 
     except KeyboardInterrupt:
         print("\n\nAbbruch durch Benutzer! Beende Blender-Prozesse...")
@@ -73,6 +102,8 @@ def main():
     print("-" * 60)
     print(f"FERTIG!")
     print(f"Gesamtdauer: {duration:.2f} Sekunden")
+    if failed:
+        print(f"Fehlgeschlagene Instanzen: {', '.join(str(i + 1) for i in failed)}")
     print("-" * 60)
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ import sys
 import os
 import math
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +25,7 @@ try:
     from randomizers.scene.scene_config import SceneRandomConfig
     from randomizers.throw.throw_config import ThrowRandomConfig
     from randomization_manager import RandomizationManager
+    from utils.node_utils import clear_geometry_node_cache
 except ImportError as e:
     print(f"Error importing randomization modules: {e}")
     # Define dummy classes
@@ -35,6 +37,7 @@ except ImportError as e:
     class PyRangeOrFixed: pass
     class PyColorVariation: pass
     class RandomizationManager: pass
+    def clear_geometry_node_cache(): pass
 
 # Global Manager Instance
 _randomization_manager = None
@@ -46,142 +49,286 @@ def get_manager(context):
         _randomization_manager = RandomizationManager(global_seed=seed, base_path=Path(current_dir))
     return _randomization_manager
 
+# Debounce for update_randomization: slider drags fire the update callback for every mouse
+# move, so the callback only schedules one rebuild which then sees the final values.
+_UPDATE_DEBOUNCE_S = 0.15
+_update_pending = False
+# Set while apply_randomization runs: settings written during randomization (e.g. by a
+# driver) must not schedule another update, or the panel would re-randomize forever.
+_in_update = False
+
+# Settings sections with their own randomizer config, and the ones changed since the last flush.
+# Only dirty sections get their config rebuilt; the first update for a manager rebuilds all.
+CONFIG_SECTIONS = frozenset({"camera", "scene", "dart", "throw", "dartboard"})
+_dirty_sections = set()
+_synced_manager = None
+# Settings values each section's current config was built from; unchanged sections keep
+# their config object, so the randomizers' per-config caches stay valid.
+_section_snapshots = {}
+
+# Camera roll settings only read by one roll mode
+_ROLL_MODE_PROPS = {
+    "roll_stddev_deg": 'TWENTY_APPROX_UP',
+    "roll_min_deg": 'RANDOM',
+    "roll_max_deg": 'RANDOM',
+}
+
+def _ignored_props(prop_group) -> frozenset:
+    """
+    Return the properties of a group that currently have no effect on the randomization
+    output, e.g. the range of a RangeOrFixed setting while its fixed value is used.
+    """
+    if hasattr(prop_group, "use_fixed"):
+        return frozenset({"min_val", "max_val"}) if prop_group.use_fixed else frozenset({"fixed_val"})
+    if hasattr(prop_group, "roll_mode"):
+        return frozenset(name for name, mode in _ROLL_MODE_PROPS.items() if prop_group.roll_mode != mode)
+    return frozenset()
+
+def _settings_snapshot(prop_group) -> tuple:
+    """
+    Return the effective values of a property group (nested groups included) as a
+    comparable tuple. Values of currently ignored properties are left out.
+    """
+    ignored = _ignored_props(prop_group)
+    values = []
+    for prop in prop_group.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.identifier in ignored:
+            continue
+        value = getattr(prop_group, prop.identifier)
+        if prop.type == 'POINTER':
+            value = _settings_snapshot(value)
+        elif getattr(prop, "is_array", False):
+            value = tuple(value)
+        values.append(value)
+    return tuple(values)
+
+def _settings_section(prop_group) -> Optional[str]:
+    """
+    Return the settings section ("camera", "dart", ...) a property group belongs to,
+    None for top-level settings (e.g. the global seed), or "*" if it cannot be determined.
+    """
+    try:
+        # e.g. "dart_generator_settings.dart.tip_length" -> "dart"
+        parts = prop_group.path_from_id().split(".")
+    except (AttributeError, TypeError, ValueError):
+        return "*"
+    if len(parts) < 2:
+        return None
+    return parts[1] if parts[1] in CONFIG_SECTIONS else "*"
+
 def update_randomization(self, context):
-    """Callback to trigger randomization when settings change."""
-    if not context or not context.scene:
+    """Callback to trigger randomization when settings change (debounced)."""
+    global _update_pending
+    if _in_update:
+        return
+    section = _settings_section(self)
+    if section == "*":
+        _dirty_sections.update(CONFIG_SECTIONS)
+    elif section is not None:
+        _dirty_sections.add(section)
+
+    if _update_pending:
+        return
+    _update_pending = True
+    bpy.app.timers.register(_flush_randomization, first_interval=_UPDATE_DEBOUNCE_S)
+
+def _flush_randomization():
+    """Timer callback: apply the settings collected since the first pending update."""
+    global _update_pending
+    _update_pending = False
+    sections = frozenset(_dirty_sections)
+    _dirty_sections.clear()
+    # A file load within the debounce window can leave a scene without the settings
+    if not hasattr(bpy.context.scene, "dart_generator_settings"):
+        return None
+    apply_randomization(bpy.context, sections, only_if_changed=True)
+    return None  # one-shot timer
+
+# Last HDRI folder string and its Path, reused while the folder setting is unchanged
+_hdri_path_cache = (None, None)
+
+def _hdri_folder_path(folder: str) -> Path:
+    global _hdri_path_cache
+    if folder != _hdri_path_cache[0]:
+        _hdri_path_cache = (folder, Path(folder))
+    return _hdri_path_cache[1]
+
+@lru_cache(maxsize=8)
+def _roll_mode(name: str):
+    return CameraRollMode[name]
+
+# DartSettings fields copied into DartRandomConfig: RangeOrFixed groups and plain values
+_DART_RANGE_FIELDS = (
+    "tip_length", "barrel_length", "barrel_thickness", "shaft_length", "shaft_shape_mix",
+    "flight_insertion_depth", "flight_roughness", "shaft_roughness", "barrel_roughness", "tip_roughness",
+)
+_DART_VALUE_FIELDS = (
+    "randomize_flight_type", "fixed_flight_index",
+    "prob_flight_texture_flags", "prob_flight_texture_outpainted", "prob_flight_gradient", "prob_flight_solid",
+    "flight_color_saturation_min", "flight_color_saturation_max", "flight_color_value_min", "flight_color_value_max",
+    "prob_shaft_gradient", "prob_shaft_solid", "prob_shaft_metallic",
+)
+
+def _to_py_range(prop):
+    return PyRangeOrFixed(min_val=prop.min_val, max_val=prop.max_val, fixed=prop.fixed_val if prop.use_fixed else None)
+
+def _to_py_color(prop):
+    return PyColorVariation(
+        base_color=tuple(prop.base_color),
+        hue_variation=prop.hue_variation,
+        saturation_variation=prop.saturation_variation,
+        value_variation=prop.value_variation,
+        randomize=prop.randomize
+    )
+
+def apply_randomization(context, sections=CONFIG_SECTIONS, only_if_changed=False):
+    """
+    Rebuild the randomizer configs of the given settings sections from the UI settings
+    and randomize the current frame. With only_if_changed, the frame is only re-randomized
+    if an effective setting or the global seed changed.
+    """
+    global _in_update
+    if _in_update or not context or not context.scene:
         return
+    _in_update = True
+    try:
+        _apply_randomization(context, sections, only_if_changed)
+    finally:
+        _in_update = False
+
+def _apply_randomization(context, sections, only_if_changed):
+    global _synced_manager
 
     mgr = get_manager(context)
-    settings = context.scene.dart_generator_settings
+    scene = context.scene
+    settings = scene.dart_generator_settings
+
+    # A new manager starts from the Python defaults: bring every config in sync once
+    if mgr is not _synced_manager:
+        sections = CONFIG_SECTIONS
+        _section_snapshots.clear()
+        _synced_manager = mgr
+
+    # Skip sections whose values did not actually change (e.g. a slider released where it started)
+    changed = set()
+    for section in sections:
+        snapshot = _settings_snapshot(getattr(settings, section))
+        if _section_snapshots.get(section) != snapshot:
+            _section_snapshots[section] = snapshot
+            changed.add(section)
+    sections = changed
     
-    if mgr.global_seed != settings.global_seed:
+    seed_changed = mgr.global_seed != settings.global_seed
+    if seed_changed:
         mgr.global_seed = settings.global_seed
+
+    # Nothing that influences the output changed (e.g. the range of a fixed-value setting)
+    if only_if_changed and not sections and not seed_changed:
+        return
     
     # --- Camera Config ---
-    cam_settings = settings.camera
-    cam_cfg = CameraRandomConfig(
-        focal_length_min=cam_settings.focal_length_min,
-        focal_length_max=cam_settings.focal_length_max,
-        sensor_width_min=cam_settings.sensor_width_min,
-        sensor_width_max=cam_settings.sensor_width_max,
-        distance_factor_min=cam_settings.distance_factor_min,
-        distance_factor_max=cam_settings.distance_factor_max,
-        polar_angle_min=cam_settings.polar_angle_min,
-        polar_angle_max=cam_settings.polar_angle_max,
-        azimuth_min=cam_settings.azimuth_min,
-        azimuth_max=cam_settings.azimuth_max,
-        look_jitter_stddev=cam_settings.look_jitter_stddev,
-        roll_mode=CameraRollMode[cam_settings.roll_mode],
-        roll_stddev_deg=cam_settings.roll_stddev_deg,
-        roll_min_deg=cam_settings.roll_min_deg,
-        roll_max_deg=cam_settings.roll_max_deg,
-        board_diameter_m=cam_settings.board_diameter_m,
-        focus_radius_max_m=cam_settings.focus_radius_max_m,
-        aperture_fstop_min=cam_settings.aperture_fstop_min,
-        aperture_fstop_max=cam_settings.aperture_fstop_max,
-    )
-    mgr.camera_randomizer.config = cam_cfg
-    
+    if "camera" in sections:
+        cam_settings = settings.camera
+        cam_cfg = CameraRandomConfig(
+            focal_length_min=cam_settings.focal_length_min,
+            focal_length_max=cam_settings.focal_length_max,
+            sensor_width_min=cam_settings.sensor_width_min,
+            sensor_width_max=cam_settings.sensor_width_max,
+            distance_factor_min=cam_settings.distance_factor_min,
+            distance_factor_max=cam_settings.distance_factor_max,
+            polar_angle_min=cam_settings.polar_angle_min,
+            polar_angle_max=cam_settings.polar_angle_max,
+            azimuth_min=cam_settings.azimuth_min,
+            azimuth_max=cam_settings.azimuth_max,
+            look_jitter_stddev=cam_settings.look_jitter_stddev,
+            roll_mode=_roll_mode(cam_settings.roll_mode),
+            roll_stddev_deg=cam_settings.roll_stddev_deg,
+            roll_min_deg=cam_settings.roll_min_deg,
+            roll_max_deg=cam_settings.roll_max_deg,
+            board_diameter_m=cam_settings.board_diameter_m,
+            focus_radius_max_m=cam_settings.focus_radius_max_m,
+            aperture_fstop_min=cam_settings.aperture_fstop_min,
+            aperture_fstop_max=cam_settings.aperture_fstop_max,
+        )
+        mgr.camera_randomizer.config = cam_cfg
+
     # --- Scene Config ---
-    scene_settings = settings.scene
-    scene_cfg = SceneRandomConfig(
-        hdri_folder=Path(scene_settings.hdri_folder),
-        hdri_strength_min=scene_settings.hdri_strength_min,
-        hdri_strength_max=scene_settings.hdri_strength_max,
-        hdri_rotation_min=scene_settings.hdri_rotation_min,
-        hdri_rotation_max=scene_settings.hdri_rotation_max
-    )
-    mgr.scene_randomizer.config = scene_cfg
-    
+    if "scene" in sections:
+        scene_settings = settings.scene
+        scene_cfg = SceneRandomConfig(
+            hdri_folder=_hdri_folder_path(scene_settings.hdri_folder),
+            hdri_strength_min=scene_settings.hdri_strength_min,
+            hdri_strength_max=scene_settings.hdri_strength_max,
+            hdri_rotation_min=scene_settings.hdri_rotation_min,
+            hdri_rotation_max=scene_settings.hdri_rotation_max
+        )
+        mgr.scene_randomizer.config = scene_cfg
+
     # --- Dart Config ---
-    dart_settings = settings.dart
-    
-    def to_py_range(prop):
-        return PyRangeOrFixed(min_val=prop.min_val, max_val=prop.max_val, fixed=prop.fixed_val if prop.use_fixed else None)
-
-    dart_cfg = DartRandomConfig(
-        tip_length=to_py_range(dart_settings.tip_length),
-        barrel_length=to_py_range(dart_settings.barrel_length),
-        barrel_thickness=to_py_range(dart_settings.barrel_thickness),
-        shaft_length=to_py_range(dart_settings.shaft_length),
-        shaft_shape_mix=to_py_range(dart_settings.shaft_shape_mix),
-        flight_insertion_depth=to_py_range(dart_settings.flight_insertion_depth),
-        randomize_flight_type=dart_settings.randomize_flight_type,
-        fixed_flight_index=dart_settings.fixed_flight_index,
-        prob_flight_texture_flags=dart_settings.prob_flight_texture_flags,
-        prob_flight_texture_outpainted=dart_settings.prob_flight_texture_outpainted,
-        prob_flight_gradient=dart_settings.prob_flight_gradient,
-        prob_flight_solid=dart_settings.prob_flight_solid,
-        flight_roughness=to_py_range(dart_settings.flight_roughness),
-        flight_color_saturation_min=dart_settings.flight_color_saturation_min,
-        flight_color_saturation_max=dart_settings.flight_color_saturation_max,
-        flight_color_value_min=dart_settings.flight_color_value_min,
-        flight_color_value_max=dart_settings.flight_color_value_max,
-        prob_shaft_gradient=dart_settings.prob_shaft_gradient,
-        prob_shaft_solid=dart_settings.prob_shaft_solid,
-        shaft_roughness=to_py_range(dart_settings.shaft_roughness),
-        prob_shaft_metallic=dart_settings.prob_shaft_metallic,
-        barrel_roughness=to_py_range(dart_settings.barrel_roughness),
-        tip_roughness=to_py_range(dart_settings.tip_roughness)
-    )
-    mgr.dart_randomizer.config = dart_cfg
-    
+    if "dart" in sections:
+        dart_settings = settings.dart
+
+        dart_kwargs = {name: _to_py_range(getattr(dart_settings, name)) for name in _DART_RANGE_FIELDS}
+        dart_kwargs.update((name, getattr(dart_settings, name)) for name in _DART_VALUE_FIELDS)
+        dart_cfg = DartRandomConfig(**dart_kwargs)
+        mgr.dart_randomizer.config = dart_cfg
+
     # --- Throw Config ---
-    throw_settings = settings.throw
-    throw_cfg = ThrowRandomConfig(
-        num_darts=throw_settings.num_darts,
-        same_appearance=throw_settings.same_appearance,
-        max_radius=throw_settings.max_radius,
-        rot_x_min=throw_settings.rot_x_min,
-        rot_x_max=throw_settings.rot_x_max,
-        rot_y_min=throw_settings.rot_y_min,
-        rot_y_max=throw_settings.rot_y_max,
-        rot_z_min=throw_settings.rot_z_min,
-        rot_z_max=throw_settings.rot_z_max,
-        embed_depth_factor_min=throw_settings.embed_depth_factor_min,
-        embed_depth_factor_max=throw_settings.embed_depth_factor_max,
-        allow_darts_outside_board=throw_settings.allow_darts_outside_board,
-        bouncer_probability=throw_settings.bouncer_probability
-    )
-    mgr.throw_randomizer.config = throw_cfg
-    
-    # --- Dartboard Config ---
-    db_settings = settings.dartboard
-    
-    def to_py_color(prop):
-        return PyColorVariation(
-            base_color=tuple(prop.base_color),
-            hue_variation=prop.hue_variation,
-            saturation_variation=prop.saturation_variation,
-            value_variation=prop.value_variation,
-            randomize=prop.randomize
+    if "throw" in sections:
+        throw_settings = settings.throw
+        throw_cfg = ThrowRandomConfig(
+            num_darts=throw_settings.num_darts,
+            same_appearance=throw_settings.same_appearance,
+            max_radius=throw_settings.max_radius,
+            rot_x_min=throw_settings.rot_x_min,
+            rot_x_max=throw_settings.rot_x_max,
+            rot_y_min=throw_settings.rot_y_min,
+            rot_y_max=throw_settings.rot_y_max,
+            rot_z_min=throw_settings.rot_z_min,
+            rot_z_max=throw_settings.rot_z_max,
+            embed_depth_factor_min=throw_settings.embed_depth_factor_min,
+            embed_depth_factor_max=throw_settings.embed_depth_factor_max,
+            allow_darts_outside_board=throw_settings.allow_darts_outside_board,
+            bouncer_probability=throw_settings.bouncer_probability
         )
+        mgr.throw_randomizer.config = throw_cfg
 
-    db_cfg = DartboardRandomConfig(
-        randomize_cracks=db_settings.randomize_cracks,
-        randomize_holes=db_settings.randomize_holes,
-        randomize_wear=db_settings.randomize_wear,
-        crack_factor=to_py_range(db_settings.crack_factor),
-        hole_factor=to_py_range(db_settings.hole_factor),
-        wear_level=to_py_range(db_settings.wear_level),
-        wear_contrast=to_py_range(db_settings.wear_contrast),
-        field_color_red=to_py_color(db_settings.field_color_red),
-        field_color_green=to_py_color(db_settings.field_color_green),
-        field_color_white=to_py_color(db_settings.field_color_white),
-    )
-    mgr.dartboard_randomizer.config = db_cfg
+    # --- Dartboard Config ---
+    if "dartboard" in sections:
+        db_settings = settings.dartboard
+
+        db_cfg = DartboardRandomConfig(
+            randomize_cracks=db_settings.randomize_cracks,
+            randomize_holes=db_settings.randomize_holes,
+            randomize_wear=db_settings.randomize_wear,
+            crack_factor=_to_py_range(db_settings.crack_factor),
+            hole_factor=_to_py_range(db_settings.hole_factor),
+            wear_level=_to_py_range(db_settings.wear_level),
+            wear_contrast=_to_py_range(db_settings.wear_contrast),
+            field_color_red=_to_py_color(db_settings.field_color_red),
+            field_color_green=_to_py_color(db_settings.field_color_green),
+            field_color_white=_to_py_color(db_settings.field_color_white),
+        )
+        mgr.dartboard_randomizer.config = db_cfg
 
     # Trigger Randomization
-    frame = context.scene.frame_current
-    camera = context.scene.camera
+    camera = scene.camera
     if camera:
         try:
-            mgr.randomize(frame, camera, context.scene)
+            mgr.randomize(scene.frame_current, camera, scene)
         except Exception as e:
             print(f"Error during live randomization: {e}")
 
 # --- Property Group Definitions ---
 
+# Enum items as a module-level constant, built once at import
+_ROLL_MODE_ITEMS = (
+    ('TWENTY_EXACT_UP', "20 Exact Up", ""),
+    ('TWENTY_APPROX_UP', "20 Approx Up", ""),
+    ('LEVEL_TO_HORIZON', "Level Horizon", ""),
+    ('RANDOM', "Random", ""),
+)
+
 class RangeOrFixedProperty(PropertyGroup):
     min_val: FloatProperty(name="Min", default=0.0, update=update_randomization)
     max_val: FloatProperty(name="Max", default=1.0, update=update_randomization)
@@ -209,12 +356,7 @@ class CameraSettings(PropertyGroup):
     look_jitter_stddev: FloatProperty(name="Look Jitter", default=0.02, update=update_randomization)
     roll_mode: EnumProperty(
         name="Roll Mode",
-        items=[
-            ('TWENTY_EXACT_UP', "20 Exact Up", ""),
-            ('TWENTY_APPROX_UP', "20 Approx Up", ""),
-            ('LEVEL_TO_HORIZON', "Level Horizon", ""),
-            ('RANDOM', "Random", "")
-        ],
+        items=_ROLL_MODE_ITEMS,
         default='TWENTY_EXACT_UP',
         update=update_randomization
     )
@@ -316,7 +458,8 @@ class OBJECT_PT_DartGeneratorPanel(Panel):
 
     def draw(self, context):
         layout = self.layout
-        settings = context.scene.dart_generator_settings
+        scene = context.scene
+        settings = scene.dart_generator_settings
         
         layout.prop(settings, "global_seed")
         layout.operator("dart.force_randomize", text="Force Randomize", icon='FILE_REFRESH')
@@ -324,9 +467,9 @@ class OBJECT_PT_DartGeneratorPanel(Panel):
         layout.label(text="Generation Settings")
         
         col = layout.column(align=True)
-        col.prop(context.scene, "frame_start", text="Start Frame")
-        col.prop(context.scene, "frame_end", text="End Frame")
-        layout.prop(context.scene, "output_path", text="Output Path")
+        col.prop(scene, "frame_start", text="Start Frame")
+        col.prop(scene, "frame_end", text="End Frame")
+        layout.prop(scene, "output_path", text="Output Path")
         
         layout.operator("dart.generate_dataset", text="Generate Dataset", icon='RENDER_ANIMATION')
 
@@ -480,6 +623,14 @@ class OBJECT_PT_DartGen_Dartboard(Panel):
     bl_region_type = 'UI'
     bl_options = {'DEFAULT_CLOSED'}
 
+    # (enable flag, range property, label) of the range settings drawn while their flag is set
+    _RANGE_PROPS = (
+        ("randomize_cracks", "crack_factor", "Crack Factor"),
+        ("randomize_holes", "hole_factor", "Hole Factor"),
+        ("randomize_wear", "wear_level", "Wear Level"),
+        ("randomize_wear", "wear_contrast", "Wear Contrast"),
+    )
+
     def draw(self, context):
         layout = self.layout
         db = context.scene.dart_generator_settings.dartboard
@@ -505,13 +656,10 @@ class OBJECT_PT_DartGen_Dartboard(Panel):
                 sub.prop(prop_group, "max_val", text="Max")
             row.prop(prop_group, "use_fixed", text="", icon='PINNED')
 
-        if db.randomize_cracks:
-            draw_range_prop(layout, db.crack_factor, "Crack Factor")
-        if db.randomize_holes:
-            draw_range_prop(layout, db.hole_factor, "Hole Factor")
-        if db.randomize_wear:
-            draw_range_prop(layout, db.wear_level, "Wear Level")
-            draw_range_prop(layout, db.wear_contrast, "Wear Contrast")
+        enabled = {flag: getattr(db, flag) for flag in ("randomize_cracks", "randomize_holes", "randomize_wear")}
+        for flag, prop_name, label in self._RANGE_PROPS:
+            if enabled[flag]:
+                draw_range_prop(layout, getattr(db, prop_name), label)
             
         layout.separator()
         layout.label(text="Colors")
@@ -602,6 +750,27 @@ class OBJECT_PT_DartGen_Throw(Panel):
         col.prop(throw, "embed_depth_factor_max", text="Max")
 
 
+# (base output path, seed, images dir, labels dir) of the last prepared dataset output
+_last_outputs = None
+
+def _ensure_output_dirs(base_out_path: str, seed: int):
+    """Return the images/labels directories for a dataset, creating them if needed."""
+    global _last_outputs
+    if _last_outputs is not None and _last_outputs[:2] == (base_out_path, seed):
+        images_dir, labels_dir = _last_outputs[2:]
+        # Same output as last time: only recreate the folders if they were removed meanwhile
+        if os.path.isdir(images_dir) and os.path.isdir(labels_dir):
+            return images_dir, labels_dir
+    else:
+        dataset_dir = os.path.join(base_out_path, str(seed))
+        images_dir = os.path.join(dataset_dir, "images")
+        labels_dir = os.path.join(dataset_dir, "labels")
+
+    os.makedirs(images_dir, exist_ok=True)
+    os.makedirs(labels_dir, exist_ok=True)
+    _last_outputs = (base_out_path, seed, images_dir, labels_dir)
+    return images_dir, labels_dir
+
 class DART_OT_GenerateDataset(Operator):
     """Generate Dataset (Render Animation)"""
     bl_idname = "dart.generate_dataset"
@@ -615,13 +784,8 @@ class DART_OT_GenerateDataset(Operator):
              return {'CANCELLED'}
 
         seed = scene.dart_generator_settings.global_seed
-        dataset_dir = os.path.join(base_out_path, str(seed))
-        images_dir = os.path.join(dataset_dir, "images")
-        labels_dir = os.path.join(dataset_dir, "labels")
-
         try:
-            os.makedirs(images_dir, exist_ok=True)
-            os.makedirs(labels_dir, exist_ok=True)
+            images_dir, labels_dir = _ensure_output_dirs(base_out_path, seed)
         except Exception as e:
             self.report({'ERROR'}, f"Could not create output directories: {e}")
             return {'CANCELLED'}
@@ -633,6 +797,7 @@ class DART_OT_GenerateDataset(Operator):
             mgr.annotation_manager.output_dir = Path(labels_dir)
             self.report({'INFO'}, f"Set label output to: {labels_dir}")
 
+        scene.dart_gen_active = True
         self.report({'INFO'}, f"Ready to generate! Images: {images_dir}, Labels: {labels_dir}")
         return {'FINISHED'}
 
@@ -643,7 +808,8 @@ class DART_OT_ForceRandomize(Operator):
     bl_label = "Force Randomize"
 
     def execute(self, context):
-        update_randomization(None, context)
+        context.scene.dart_gen_active = True
+        apply_randomization(context)
         return {'FINISHED'}
 
 class DART_OT_ResetSettings(Operator):
@@ -653,91 +819,37 @@ class DART_OT_ResetSettings(Operator):
     
     setting_group: StringProperty()
     
-    def _reset_recursive(self, prop_group):
-        """Recursively reset properties to default."""
-        for prop_name, prop_val in prop_group.bl_rna.properties.items():
-            if prop_name in {"rna_type", "name"}:
-                continue
-            
-            # Reset this property
-            if not prop_group.is_property_readonly(prop_name):
-                 prop_group.property_unset(prop_name)
-                 
-            # Recurse if PointerProperty
-            if prop_name in prop_group.__annotations__ and isinstance(prop_group.__annotations__[prop_name], PointerProperty):
-                 # Note: PointerProperty definitions in class annotations vs instances
-                 # We need to access the actual object
-                 sub_obj = getattr(prop_group, prop_name)
-                 if sub_obj:
-                    self._reset_recursive(sub_obj)
-
     def execute(self, context):
-        settings = context.scene.dart_generator_settings
-        group_name = self.setting_group
-        
-        target = None
-        if group_name == "camera":
-            target = settings.camera
-        elif group_name == "dart" or group_name == "dart_mat":
-            target = settings.dart
-        elif group_name == "dartboard":
-            target = settings.dartboard
-        elif group_name == "scene":
-            target = settings.scene
-        elif group_name == "throw":
-            target = settings.throw
-            
-        if target:
-            # We need to manually reset complex nested structures for some panels
-            # But property_unset generally handles simple defaults. 
-            # For strict complex defaults (like specific colors), we might need manual handling if defaults weren't registered perfectly.
-            # But let's try generic recursive unset first.
-            
-            # Helper to set complex defaults
-            # Actually, because we defined defaults in PropertyGroups above using the same values as config, 
-            # property_unset() will revert to those defaults!
-            
-            
-            # Reset logic for Darts & Dartboard specifically needs deep recursion
-            if group_name == "dart":
-                 # Iterate over known pointer props
-                 for attr in dir(target):
-                     if attr in ["tip_length", "barrel_length", "barrel_thickness", "shaft_length", "shaft_shape_mix", "flight_insertion_depth", "flight_roughness", "barrel_roughness", "tip_roughness", "shaft_roughness"]:
-                         sub = getattr(target, attr)
-                         sub.property_unset("min_val")
-                         sub.property_unset("max_val")
-                         sub.property_unset("fixed_val")
-                         sub.property_unset("use_fixed")
-
-            if group_name == "dartboard":
-                 for attr in dir(target):
-                    if attr in ["crack_factor", "hole_factor", "wear_level", "wear_contrast"]:
-                         sub = getattr(target, attr)
-                         sub.property_unset("min_val")
-                         sub.property_unset("max_val")
-                         sub.property_unset("fixed_val")
-                         sub.property_unset("use_fixed")
-                    if attr in ["field_color_red", "field_color_green", "field_color_white"]:
-                         sub = getattr(target, attr)
-                         sub.property_unset("base_color")
-                         sub.property_unset("hue_variation")
-                         sub.property_unset("saturation_variation")
-                         sub.property_unset("value_variation")
-                         sub.property_unset("randomize")
-
-            # Generic reset for standard props
-            for k in target.bl_rna.properties.keys():
-                if k not in ["rna_type", "name"] and not target.is_property_readonly(k):
-                    target.property_unset(k)
-            
-            update_randomization(self, context)
-            self.report({'INFO'}, f"Reset {group_name} settings to default")
-
+        group = self.setting_group
+        defaults = _RESET_DEFAULTS.get(group)
+        if defaults is not None:
+            section, values, ranges, colors = defaults
+            target = getattr(context.scene.dart_generator_settings, section)
+            for name, value in values.items():
+                setattr(target, name, value)
+            for name, (min_v, max_v) in ranges.items():
+                prop = getattr(target, name)
+                prop.min_val = min_v
+                prop.max_val = max_v
+                prop.use_fixed = False
+            for name, (base_color, hue_var, sat_var, val_var) in colors.items():
+                prop = getattr(target, name)
+                prop.base_color = base_color
+                prop.hue_variation = hue_var
+                prop.saturation_variation = sat_var
+                prop.value_variation = val_var
+                prop.randomize = True
+
+        update_randomization(self, context)
+        self.report({'INFO'}, f"Reset {group} settings to defaults.")
         return {'FINISHED'}
 
 # Handlers
 @persistent
 def on_frame_change_pre(scene):
+    # Idle add-on: skip before touching the manager
+    if not scene.dart_gen_active:
+        return
     mgr = get_manager(bpy.context)
     if not mgr:
         return
@@ -751,6 +863,8 @@ def on_frame_change_pre(scene):
 
 @persistent
 def on_render_post(scene):
+    if not scene.dart_gen_active:
+        return
     mgr = get_manager(bpy.context)
     if not mgr:
         return
@@ -763,9 +877,21 @@ def on_render_post(scene):
 
 @persistent
 def load_post_handler(dummy):
+    # Node groups of the previous file are freed; their addresses may be reused
+    clear_geometry_node_cache()
     if bpy.context:
         get_manager(bpy.context)
 
+def _init_manager_deferred():
+    """
+    Timer callback: create the manager right after the add-on is enabled, so the first
+    settings change does not pay for its construction. register() itself only has a
+    restricted context without a scene.
+    """
+    if bpy.context.scene is not None:
+        get_manager(bpy.context)
+    return None  # one-shot timer
+
 def setup_defaults():
     # Helper to enforce initialization of complex defaults when addon is enabled?
     # Usually Blender handles 'default' arg in Property definition well.
@@ -824,10 +950,16 @@ def register():
         default="//output/",
         subtype='DIR_PATH'
     )
+    bpy.types.Scene.dart_gen_active = BoolProperty(
+        name="Dart Generator Active",
+        description="Randomize on frame change and write labels after rendering",
+        default=False
+    )
     
     bpy.app.handlers.frame_change_pre.append(on_frame_change_pre)
     bpy.app.handlers.render_post.append(on_render_post)
     bpy.app.handlers.load_post.append(load_post_handler)
+    bpy.app.timers.register(_init_manager_deferred, first_interval=0.0)
     
     # Init Defaults Hack:
     # Since we can't define instance-specific defaults for PointerProperties in class defs,
@@ -848,134 +980,142 @@ def register():
     # I will update the Reset Operator to manually set the correct values instead of `property_unset`.
 
 def unregister():
+    global _update_pending
     if on_frame_change_pre in bpy.app.handlers.frame_change_pre:
         bpy.app.handlers.frame_change_pre.remove(on_frame_change_pre)
     if on_render_post in bpy.app.handlers.render_post:
         bpy.app.handlers.render_post.remove(on_render_post)
     if load_post_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(load_post_handler)
-
-    del bpy.types.Scene.dart_generator_settings
-    if hasattr(bpy.types.Scene, "output_path"):
-        del bpy.types.Scene.output_path
+    if bpy.app.timers.is_registered(_init_manager_deferred):
+        bpy.app.timers.unregister(_init_manager_deferred)
+    # A pending debounced update would otherwise fire after the settings are deleted
+    if bpy.app.timers.is_registered(_flush_randomization):
+        bpy.app.timers.unregister(_flush_randomization)
+    _update_pending = False
+    _dirty_sections.clear()
+
+    for prop_name in ("dart_generator_settings", "output_path", "dart_gen_active"):
+        try:
+            delattr(bpy.types.Scene, prop_name)
+        except AttributeError:
+            pass
 
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
-# Update Reset Operator with explicit defaults
-def _set_range(prop, min_v, max_v):
-    prop.min_val = min_v
-    prop.max_val = max_v
-    prop.use_fixed = False
-
-def _set_color(prop, col, h=0, s=0, v=0, rand=True):
-    prop.base_color = col
-    prop.hue_variation = h
-    prop.saturation_variation = s
-    prop.value_variation = v
-    prop.randomize = rand
-    
-DART_OT_ResetSettings.execute = lambda self, context: _execute_reset(self, context)
-
-def _execute_reset(self, context):
-    settings = context.scene.dart_generator_settings
-    group = self.setting_group
-    
-    if group == "camera":
-        c = settings.camera
-        c.focal_length_min = 20.0
-        c.focal_length_max = 60.0
-        c.sensor_width_min = 8.0
-        c.sensor_width_max = 36.0
-        c.distance_factor_min = 1.0
-        c.distance_factor_max = 2.0
-        c.polar_angle_min = 0.0
-        c.polar_angle_max = 75.0
-        c.azimuth_min = 0.0
-        c.azimuth_max = 360.0
-        c.look_jitter_stddev = 0.02
-        c.roll_mode = 'TWENTY_EXACT_UP'
-        c.roll_stddev_deg = 6.0
-        c.roll_min_deg = -180.0
-        c.roll_max_deg = 180.0
-        c.board_diameter_m = 0.44
-        c.focus_radius_max_m = 0.225
-        c.aperture_fstop_min = 0.8
-        c.aperture_fstop_max = 5.6
-        
-    elif group == "dart" or group == "dart_mat":
-        # We reset both if either is clicked, or split?
-        # Let's split logic but they share same Settings Object
-        d = settings.dart
-        
-        if group == "dart":
-            _set_range(d.tip_length, 20.0, 45.0)
-            _set_range(d.barrel_length, 40.0, 55.0)
-            _set_range(d.barrel_thickness, 0.15, 5.0)
-            _set_range(d.shaft_length, 26.0, 56.0)
-            _set_range(d.shaft_shape_mix, 0.0, 1.0)
-            _set_range(d.flight_insertion_depth, 10.0, 20.0)
-            d.randomize_flight_type = True
-            d.fixed_flight_index = 100
-            
-        if group == "dart_mat" or group == "dart": # Reset materials too if wanted, or separate
-            d.prob_flight_texture_flags = 0.3
-            d.prob_flight_texture_outpainted = 0.5
-            d.prob_flight_gradient = 0.1
-            d.prob_flight_solid = 0.1
-            _set_range(d.flight_roughness, 0.0, 1.0)
-            d.flight_color_saturation_min = 0.5
-            d.flight_color_saturation_max = 1.0
-            d.flight_color_value_min = 0.5
-            d.flight_color_value_max = 1.0
-            d.prob_shaft_gradient = 0.5
-            d.prob_shaft_solid = 0.5
-            _set_range(d.shaft_roughness, 0.0, 0.8)
-            d.prob_shaft_metallic = 0.5
-            _set_range(d.barrel_roughness, 0.0, 0.5)
-            _set_range(d.tip_roughness, 0.0, 0.5)
-
-    elif group == "dartboard":
-        db = settings.dartboard
-        db.randomize_cracks = False
-        db.randomize_holes = True
-        db.randomize_wear = True
-        _set_range(db.crack_factor, 0.0, 1.0)
-        _set_range(db.hole_factor, 0.0, 1.0)
-        _set_range(db.wear_level, 0.0, 1.0)
-        _set_range(db.wear_contrast, 0.5, 1.0)
-        _set_color(db.field_color_red, (0.8, 0.1, 0.1, 1.0), 0.02, 0.1, 0.15)
-        _set_color(db.field_color_green, (0.1, 0.5, 0.1, 1.0), 0.02, 0.1, 0.15)
-        _set_color(db.field_color_white, (0.9, 0.9, 0.85, 1.0), 0.0, 0.5, 0.1)
-        
-    elif group == "scene":
-        s = settings.scene
-        s.hdri_folder = "assets/HDRIs"
-        s.hdri_strength_min = 0.2
-        s.hdri_strength_max = 1.5
-        s.hdri_rotation_min = 0.0
-        s.hdri_rotation_max = 6.28318530718
-        
-    elif group == "throw":
-        t = settings.throw
-        t.num_darts = 3
-        t.same_appearance = False
-        t.max_radius = 0.25
-        t.rot_x_min = -10.0
-        t.rot_x_max = 10.0
-        t.rot_y_min = -10.0
-        t.rot_y_max = 10.0
-        t.rot_z_min = 0.0
-        t.rot_z_max = 360.0
-        t.embed_depth_factor_min = 0.1
-        t.embed_depth_factor_max = 0.8
-        t.allow_darts_outside_board = False
-        t.bouncer_probability = 0.0
-
-    update_randomization(self, context)
-    self.report({'INFO'}, f"Reset {group} settings to defaults.")
-    return {'FINISHED'}
-
+# Reset defaults per settings section: plain values, RangeOrFixed groups as (min, max)
+# and ColorVariation groups as (base color, hue var, sat var, val var)
+_CAMERA_DEFAULTS = {
+    "focal_length_min": 20.0,
+    "focal_length_max": 60.0,
+    "sensor_width_min": 8.0,
+    "sensor_width_max": 36.0,
+    "distance_factor_min": 1.0,
+    "distance_factor_max": 2.0,
+    "polar_angle_min": 0.0,
+    "polar_angle_max": 75.0,
+    "azimuth_min": 0.0,
+    "azimuth_max": 360.0,
+    "look_jitter_stddev": 0.02,
+    "roll_mode": 'TWENTY_EXACT_UP',
+    "roll_stddev_deg": 6.0,
+    "roll_min_deg": -180.0,
+    "roll_max_deg": 180.0,
+    "board_diameter_m": 0.44,
+    "focus_radius_max_m": 0.225,
+    "aperture_fstop_min": 0.8,
+    "aperture_fstop_max": 5.6,
+}
+
+_DART_GEOMETRY_DEFAULTS = {
+    "randomize_flight_type": True,
+    "fixed_flight_index": 100,
+}
+_DART_GEOMETRY_RANGES = {
+    "tip_length": (20.0, 45.0),
+    "barrel_length": (40.0, 55.0),
+    "barrel_thickness": (0.15, 5.0),
+    "shaft_length": (26.0, 56.0),
+    "shaft_shape_mix": (0.0, 1.0),
+    "flight_insertion_depth": (10.0, 20.0),
+}
+
+_DART_MATERIAL_DEFAULTS = {
+    "prob_flight_texture_flags": 0.3,
+    "prob_flight_texture_outpainted": 0.5,
+    "prob_flight_gradient": 0.1,
+    "prob_flight_solid": 0.1,
+    "flight_color_saturation_min": 0.5,
+    "flight_color_saturation_max": 1.0,
+    "flight_color_value_min": 0.5,
+    "flight_color_value_max": 1.0,
+    "prob_shaft_gradient": 0.5,
+    "prob_shaft_solid": 0.5,
+    "prob_shaft_metallic": 0.5,
+}
+_DART_MATERIAL_RANGES = {
+    "flight_roughness": (0.0, 1.0),
+    "shaft_roughness": (0.0, 0.8),
+    "barrel_roughness": (0.0, 0.5),
+    "tip_roughness": (0.0, 0.5),
+}
+
+_DARTBOARD_DEFAULTS = {
+    "randomize_cracks": False,
+    "randomize_holes": True,
+    "randomize_wear": True,
+}
+_DARTBOARD_RANGES = {
+    "crack_factor": (0.0, 1.0),
+    "hole_factor": (0.0, 1.0),
+    "wear_level": (0.0, 1.0),
+    "wear_contrast": (0.5, 1.0),
+}
+_DARTBOARD_COLORS = {
+    "field_color_red": ((0.8, 0.1, 0.1, 1.0), 0.02, 0.1, 0.15),
+    "field_color_green": ((0.1, 0.5, 0.1, 1.0), 0.02, 0.1, 0.15),
+    "field_color_white": ((0.9, 0.9, 0.85, 1.0), 0.0, 0.5, 0.1),
+}
+
+_SCENE_DEFAULTS = {
+    "hdri_folder": "assets/HDRIs",
+    "hdri_strength_min": 0.2,
+    "hdri_strength_max": 1.5,
+    "hdri_rotation_min": 0.0,
+    "hdri_rotation_max": 6.28318530718,
+}
+
+_THROW_DEFAULTS = {
+    "num_darts": 3,
+    "same_appearance": False,
+    "max_radius": 0.25,
+    "rot_x_min": -10.0,
+    "rot_x_max": 10.0,
+    "rot_y_min": -10.0,
+    "rot_y_max": 10.0,
+    "rot_z_min": 0.0,
+    "rot_z_max": 360.0,
+    "embed_depth_factor_min": 0.1,
+    "embed_depth_factor_max": 0.8,
+    "allow_darts_outside_board": False,
+    "bouncer_probability": 0.0,
+}
+
+# setting_group of the reset buttons -> (settings section, values, ranges, colors)
+_RESET_DEFAULTS = {
+    "camera": ("camera", _CAMERA_DEFAULTS, {}, {}),
+    "dart": (
+        "dart",
+        {**_DART_GEOMETRY_DEFAULTS, **_DART_MATERIAL_DEFAULTS},
+        {**_DART_GEOMETRY_RANGES, **_DART_MATERIAL_RANGES},
+        {},
+    ),
+    "dart_mat": ("dart", _DART_MATERIAL_DEFAULTS, _DART_MATERIAL_RANGES, {}),
+    "dartboard": ("dartboard", _DARTBOARD_DEFAULTS, _DARTBOARD_RANGES, _DARTBOARD_COLORS),
+    "scene": ("scene", _SCENE_DEFAULTS, {}, {}),
+    "throw": ("throw", _THROW_DEFAULTS, {}, {}),
+}
 
 if __name__ == "__main__":
     register()
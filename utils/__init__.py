@@ -3,10 +3,17 @@ from .camera_utils import *
 from .node_utils import (
     find_node_group,
     find_all_node_groups,
+    iter_node_groups,
     set_node_input,
+    map_node_inputs,
+    find_mapped_input,
+    set_mapped_input,
     get_node_input,
+    get_geometry_node_input_identifier,
     set_geometry_node_input,
+    set_geometry_node_inputs,
     get_geometry_node_input,
+    clear_geometry_node_cache,
     list_geometry_node_inputs,
 )
 from .color_utils import (
@@ -15,6 +22,10 @@ from .color_utils import (
     lerp_color,
     rgb_to_hsv,
     hsv_to_rgb,
+    hsv_to_rgb_array,
+    rgb_to_hsv_array,
+    randomize_colors_hsv,
+    randomize_colors_value,
     adjust_brightness,
     adjust_saturation,
 )
@@ -13,6 +13,8 @@ def get_render_aspect_ratio(scene=None):
 
 def get_camera_aspect_ratio(camera):
     """Calculate the camera's aspect ratio based on sensor dimensions."""
-    if camera.data.sensor_height <= 0:
+    cam_data = camera.data
+    sensor_height = cam_data.sensor_height
+    if sensor_height <= 0:
         raise ValueError("sensor_height must be > 0")
-    return camera.data.sensor_width / camera.data.sensor_height
\ No newline at end of file
+    return cam_data.sensor_width / sensor_height
\ No newline at end of file
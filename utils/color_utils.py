@@ -6,10 +6,12 @@ Contains helpers for:
 - Color randomization
 """
 
-import colorsys
+from colorsys import rgb_to_hsv as _rgb2hsv, hsv_to_rgb as _hsv2rgb
 from typing import Tuple
 from random import Random
 
+import numpy as np
+
 
 def randomize_color_hsv(
     base_color: Tuple[float, float, float, float],
@@ -38,21 +40,22 @@ def randomize_color_hsv(
         (0.82, 0.09, 0.11, 1.0)  # Slightly varied red
     """
     r, g, b, a = base_color
-    h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    h, s, v = _rgb2hsv(r, g, b)
+    uniform = rng.uniform
     
     # Hue variation (modulo 1.0 for wrap-around)
     if hue_variation > 0:
-        h = (h + rng.uniform(-hue_variation, hue_variation)) % 1.0
+        h = (h + uniform(-hue_variation, hue_variation)) % 1.0
     
     # Saturation variation (clamped to 0-1)
     if saturation_variation > 0:
-        s = clamp(s + rng.uniform(-saturation_variation, saturation_variation), 0.0, 1.0)
+        s = max(0.0, min(1.0, s + uniform(-saturation_variation, saturation_variation)))
     
     # Value variation (clamped to 0-1)
     if value_variation > 0:
-        v = clamp(v + rng.uniform(-value_variation, value_variation), 0.0, 1.0)
+        v = max(0.0, min(1.0, v + uniform(-value_variation, value_variation)))
     
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    r, g, b = _hsv2rgb(h, s, v)
     return (r, g, b, a)
 
 
@@ -77,21 +80,145 @@ def lerp_color(
     Returns:
         Interpolated color
     """
-    factor = clamp(factor, 0.0, 1.0)
-    return tuple(
-        a + (b - a) * factor
-        for a, b in zip(color_a, color_b)
+    f = max(0.0, min(1.0, factor))
+    r_a, g_a, b_a, a_a = color_a
+    r_b, g_b, b_b, a_b = color_b
+    return (
+        r_a + (r_b - r_a) * f,
+        g_a + (g_b - g_a) * f,
+        b_a + (b_b - b_a) * f,
+        a_a + (a_b - a_a) * f,
     )
 
 
 def rgb_to_hsv(color: Tuple[float, float, float]) -> Tuple[float, float, float]:
     """Convert RGB to HSV."""
-    return colorsys.rgb_to_hsv(*color)
+    return _rgb2hsv(*color)
 
 
 def hsv_to_rgb(color: Tuple[float, float, float]) -> Tuple[float, float, float]:
     """Convert HSV to RGB."""
-    return colorsys.hsv_to_rgb(*color)
+    return _hsv2rgb(*color)
+
+
+def rgb_to_hsv_array(rgb) -> np.ndarray:
+    """
+    Vectorized RGB to HSV conversion (same result as colorsys.rgb_to_hsv).
+    
+    Args:
+        rgb: Array of shape (..., 3) with values 0-1
+        
+    Returns:
+        Array of shape (..., 3) with the HSV values
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    delta = maxc - minc
+    grey = delta == 0.0
+    # Avoid division by zero for grey colors; their h and s are 0
+    safe_delta = np.where(grey, 1.0, delta)
+    safe_max = np.where(maxc == 0.0, 1.0, maxc)
+    
+    s = np.where(grey, 0.0, delta / safe_max)
+    rc = (maxc - r) / safe_delta
+    gc = (maxc - g) / safe_delta
+    bc = (maxc - b) / safe_delta
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(grey, 0.0, (h / 6.0) % 1.0)
+    return np.stack((h, s, maxc), axis=-1)
+
+
+def randomize_colors_hsv(
+    base_colors,
+    variations,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Vectorized randomize_color_hsv for several colors at once.
+    
+    Args:
+        base_colors: Array of shape (N, 4) with RGBA base colors (values 0-1)
+        variations: Array of shape (N, 3) with the ±hue, saturation and value
+                    variation per color (values <= 0 disable that channel)
+        rng: NumPy generator for deterministic results
+        
+    Returns:
+        Array of shape (N, 4) with the randomized RGBA colors
+    """
+    base_colors = np.asarray(base_colors, dtype=np.float64)
+    variations = np.maximum(np.asarray(variations, dtype=np.float64), 0.0)
+    
+    hsv = rgb_to_hsv_array(base_colors[:, :3])
+    hsv += rng.uniform(-1.0, 1.0, size=hsv.shape) * variations
+    hsv[:, 0] %= 1.0
+    np.clip(hsv[:, 1:], 0.0, 1.0, out=hsv[:, 1:])
+    
+    result = base_colors.copy()
+    result[:, :3] = hsv_to_rgb_array(hsv[:, 0], hsv[:, 1], hsv[:, 2])
+    return result
+
+
+def randomize_colors_value(
+    base_colors,
+    value_variations,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Value-only variant of randomize_colors_hsv without an HSV round trip.
+    
+    With hue and saturation unchanged, changing the HSV value from v to v'
+    is the same as scaling RGB by v'/v, so only the max channel is needed.
+    
+    Args:
+        base_colors: Array of shape (N, 4) with RGBA base colors (values 0-1)
+        value_variations: Array of shape (N,) with the ±value variation per color
+        rng: NumPy generator for deterministic results
+        
+    Returns:
+        Array of shape (N, 4) with the randomized RGBA colors
+    """
+    base_colors = np.asarray(base_colors, dtype=np.float64)
+    value_variations = np.maximum(np.asarray(value_variations, dtype=np.float64), 0.0)
+    
+    v = base_colors[:, :3].max(axis=1)
+    new_v = np.clip(v + rng.uniform(-1.0, 1.0, size=v.shape) * value_variations, 0.0, 1.0)
+    
+    result = base_colors.copy()
+    lit = v > 0.0
+    result[lit, :3] *= (new_v[lit] / v[lit])[:, None]
+    # Pure black has no hue to keep: it becomes the grey of the new value, as in colorsys
+    result[~lit, :3] = new_v[~lit, None]
+    return result
+
+
+def hsv_to_rgb_array(h, s, v) -> np.ndarray:
+    """
+    Vectorized HSV to RGB conversion (same result as colorsys.hsv_to_rgb).
+    
+    Args:
+        h, s, v: Arrays (or scalars) of equal shape with values 0-1
+        
+    Returns:
+        Array of shape (..., 3) with the RGB values
+    """
+    h = np.asarray(h, dtype=np.float64)
+    s = np.asarray(s, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+    
+    sector = np.floor(h * 6.0)
+    f = h * 6.0 - sector
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    sector = sector.astype(np.int64) % 6
+    
+    r = np.choose(sector, (v, q, p, p, t, v))
+    g = np.choose(sector, (t, v, v, q, p, p))
+    b = np.choose(sector, (p, p, t, v, v, q))
+    return np.stack((r, g, b), axis=-1)
 
 
 def adjust_brightness(
@@ -109,9 +236,9 @@ def adjust_brightness(
         Adjusted color
     """
     r, g, b, a = color
-    h, s, v = colorsys.rgb_to_hsv(r, g, b)
-    v = clamp(v * factor, 0.0, 1.0)
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    h, s, v = _rgb2hsv(r, g, b)
+    v = max(0.0, min(1.0, v * factor))
+    r, g, b = _hsv2rgb(h, s, v)
     return (r, g, b, a)
 
 
@@ -130,7 +257,7 @@ def adjust_saturation(
         Adjusted color
     """
     r, g, b, a = color
-    h, s, v = colorsys.rgb_to_hsv(r, g, b)
-    s = clamp(s * factor, 0.0, 1.0)
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    h, s, v = _rgb2hsv(r, g, b)
+    s = max(0.0, min(1.0, s * factor))
+    r, g, b = _hsv2rgb(h, s, v)
     return (r, g, b, a)
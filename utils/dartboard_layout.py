@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 class DartboardLayout:
     """
     Represents the physical layout of a standard WDF dartboard.
@@ -23,9 +25,18 @@ class DartboardLayout:
     # Default dart tip radius in mm (used for collision checks)
     DEFAULT_R_TIP = 1.1
 
+    # 20 segments of 18 degrees each; the radial wires sit at +/- half a segment
+    SEGMENT_ANGLE = 2 * math.pi / 20
+    HALF_SEGMENT = SEGMENT_ANGLE / 2
+
     def __init__(self, r_tip: float = DEFAULT_R_TIP):
         self.r_tip = r_tip
         self.invalid_intervals = self._calculate_invalid_intervals()
+        # Sorted interval bounds as arrays, so validate_radii can find the interval
+        # of every radius with one binary search instead of testing each interval
+        bounds = np.array(sorted(self.invalid_intervals), dtype=np.float64).reshape(-1, 2)
+        self._interval_starts = bounds[:, 0].copy()
+        self._interval_ends = bounds[:, 1].copy()
 
     def _calculate_invalid_intervals(self):
         """
@@ -121,8 +132,8 @@ class DartboardLayout:
         # 0 degrees is at the center of the "6" segment (Right)
         # Wires are at +/- 9 degrees (pi/20) from the center of each segment
         
-        segment_angle = 2 * math.pi / 20 # 18 degrees
-        half_segment = segment_angle / 2 # 9 degrees
+        segment_angle = self.SEGMENT_ANGLE # 18 degrees
+        half_segment = self.HALF_SEGMENT # 9 degrees
         
         # Shift angle so that wires are at 0, segment_angle, 2*segment_angle...
         # Original wires: +/- 9 deg, +/- 27 deg...
@@ -150,6 +161,60 @@ class DartboardLayout:
                 
         return angle_rad
 
+    def validate_radii(self, radii_m: np.ndarray) -> np.ndarray:
+        """
+        Vectorized validate_radius for many darts at once.
+        
+        Args:
+            radii_m: Radii in meters.
+            
+        Returns:
+            Adjusted radii in meters as NumPy array.
+        """
+        r_mm = np.asarray(radii_m, dtype=np.float64) * 1000.0
+        
+        # Snap to the nearer boundary of the (disjoint) invalid interval the radius falls in.
+        # The candidate interval is the last one starting below the radius.
+        idx = np.searchsorted(self._interval_starts, r_mm, side="left") - 1
+        valid_idx = idx >= 0
+        idx = np.where(valid_idx, idx, 0)
+        start = self._interval_starts[idx]
+        end = self._interval_ends[idx]
+        inside = valid_idx & (r_mm < end)
+        r_mm = np.where(inside, np.where(r_mm - start < end - r_mm, start, end), r_mm)
+        
+        return r_mm / 1000.0
+
+    def validate_polar_arrays(self, radii_m: np.ndarray, angles_rad: np.ndarray):
+        """
+        Vectorized validate_radius followed by validate_angle for many darts at once.
+        
+        Args:
+            radii_m: Radii in meters.
+            angles_rad: Angles in radians.
+            
+        Returns:
+            Tuple (radii_m, angles_rad) of adjusted NumPy arrays.
+        """
+        radii = self.validate_radii(radii_m)
+        r_mm = radii * 1000.0
+        
+        # Angle: same radial wire check as validate_angle, applied where it is defined
+        margin_mm = 0.6 + self.r_tip
+        active = (15.8 <= r_mm) & (r_mm <= 180.0) & (margin_mm < r_mm)
+        dtheta = np.arcsin(margin_mm / np.maximum(r_mm, margin_mm))
+        
+        segment_angle = self.SEGMENT_ANGLE
+        half_segment = self.HALF_SEGMENT
+        angles = np.asarray(angles_rad, dtype=np.float64)
+        angle_mod = np.mod(angles + half_segment, segment_angle)
+        dist_to_wire = np.minimum(angle_mod, segment_angle - angle_mod)
+        
+        correction = np.where(angle_mod < half_segment, 1.0, -1.0) * (dtheta - dist_to_wire)
+        angles = np.where(active & (dist_to_wire < dtheta), angles + correction, angles)
+        
+        return radii, angles
+
     def get_field_from_polar(self, radius_m: float, angle_rad: float):
         """
         Determines the dartboard field from polar coordinates.
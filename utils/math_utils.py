@@ -1,5 +1,9 @@
 import math
 
+# Bound once: sph_to_cart/cyl_to_cart run on every camera randomization
+_sin = math.sin
+_cos = math.cos
+
 # ---------------------------------------------------------------------------
 # SPHERICAL COORDINATES
 # ---------------------------------------------------------------------------
@@ -16,10 +20,10 @@ def sph_to_cart(r: float, theta: float, phi: float) -> tuple[float, float, float
     Returns:
         (x, y, z): Cartesian coordinates.
     """
-    sin_theta = math.sin(theta)
-    x = r * sin_theta * math.cos(phi)
-    y = r * sin_theta * math.sin(phi)
-    z = r * math.cos(theta)
+    sin_theta = _sin(theta)
+    x = r * sin_theta * _cos(phi)
+    y = r * sin_theta * _sin(phi)
+    z = r * _cos(theta)
     return x, y, z
 
 
@@ -33,7 +37,7 @@ def cart_to_sph(x: float, y: float, z: float) -> tuple[float, float, float]:
             theta = angle from Z-axis
             phi   = angle in XY-plane from +X
     """
-    r = math.sqrt(x*x + y*y + z*z)
+    r = math.hypot(x, y, z)
     theta = math.acos(z / r) if r != 0 else 0.0
     phi = math.atan2(y, x)
     return r, theta, phi
@@ -55,8 +59,8 @@ def cyl_to_cart(r: float, phi: float, z: float) -> tuple[float, float, float]:
     Returns:
         (x, y, z)
     """
-    x = r * math.cos(phi)
-    y = r * math.sin(phi)
+    x = r * _cos(phi)
+    y = r * _sin(phi)
     return x, y, z
 
 
@@ -70,10 +74,6 @@ def cart_to_cyl(x: float, y: float, z: float) -> tuple[float, float, float]:
           phi = atan2(y, x)
           z   = z (unchanged)
     """
-    r = math.sqrt(x*x + y*y)
+    r = math.hypot(x, y)
     phi = math.atan2(y, x)
     return r, phi, z
-
-
-
-
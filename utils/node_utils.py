@@ -7,7 +7,52 @@ Contains helpers for:
 """
 
 import bpy
-from typing import Any, Optional, List
+from typing import Any, Optional, List, Dict, Tuple, Iterator
+
+
+# Input sockets per Geometry Nodes group: as_pointer() -> ((item count, name_full),
+# name -> identifier, identifiers). The stamp catches added/removed sockets and a freed
+# group whose address was reused by another one; renaming a socket in place is not
+# detected (the node groups are fixed during generation). Cleared on file load.
+_ng_iface_cache: Dict[int, Tuple[Tuple[int, str], Dict[str, str], Tuple[str, ...]]] = {}
+
+
+def clear_geometry_node_cache() -> None:
+    """Drop the cached node group inputs, e.g. after a new .blend file was loaded."""
+    _ng_iface_cache.clear()
+
+
+def _geometry_node_inputs(node_group: bpy.types.NodeTree) -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """
+    Return (name or identifier -> identifier, identifiers) of a node group's input sockets, cached.
+    Display names take precedence over identifiers, like the linear search did.
+    """
+    items = node_group.interface.items_tree
+    stamp = (len(items), node_group.name_full)
+    key = node_group.as_pointer()
+    cached = _ng_iface_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    
+    names = {}
+    identifiers = []
+    for item in items:
+        if item.item_type == 'SOCKET' and item.in_out == 'INPUT':
+            # First socket wins for duplicate names, like the linear search did
+            names.setdefault(item.name, item.identifier)
+            identifiers.append(item.identifier)
+    identifiers = tuple(identifiers)
+    for identifier in identifiers:
+        names.setdefault(identifier, identifier)
+    _ng_iface_cache[key] = (stamp, names, identifiers)
+    return names, identifiers
+
+
+def _partial_name_match(group_name: str, tree_name: str) -> bool:
+    """True if one name contains the other; only the shorter one can be inside the longer."""
+    if len(tree_name) < len(group_name):
+        return tree_name in group_name
+    return group_name in tree_name
 
 
 def find_node_group(
@@ -26,18 +71,55 @@ def find_node_group(
     Returns:
         The found node or None
     """
+    # Collect the group nodes with their tree names once (one RNA read each)
+    groups = []
+    append = groups.append
     for node in node_tree.nodes:
-        if node.type == 'GROUP' and node.node_tree:
-            # Exact match
-            if node.node_tree.name == group_name:
+        if node.type == 'GROUP':
+            tree = node.node_tree
+            if tree is not None:
+                append((node, tree.name))
+    
+    # Exact match first, so a partial match earlier in the tree cannot shadow it
+    for node, tree_name in groups:
+        if tree_name == group_name:
+            return node
+    
+    # Partial match as fallback (if not exact_match), e.g. for renamed "_Unique" copies
+    if not exact_match:
+        for node, tree_name in groups:
+            if _partial_name_match(group_name, tree_name):
                 return node
-            # Partial match as fallback (if not exact_match)
-            if not exact_match:
-                if group_name in node.node_tree.name or node.node_tree.name in group_name:
-                    return node
     return None
 
 
+def iter_node_groups(
+    node_tree: bpy.types.NodeTree,
+    group_name: str = None
+) -> Iterator[bpy.types.Node]:
+    """
+    Iterate over the node groups in the node tree.
+    
+    Args:
+        node_tree: The node tree to search in
+        group_name: Optional - filter by this name (partial match)
+        
+    Yields:
+        The matching group nodes
+    """
+    for node in node_tree.nodes:
+        if node.type != 'GROUP':
+            continue
+        tree = node.node_tree
+        if tree is None:
+            continue
+        if group_name is None:
+            yield node
+            continue
+        if _partial_name_match(group_name, tree.name):
+            yield node
+
+
 def find_all_node_groups(
     node_tree: bpy.types.NodeTree,
     group_name: str = None
@@ -52,14 +134,7 @@ def find_all_node_groups(
     Returns:
         List of all found group nodes
     """
-    groups = []
-    for node in node_tree.nodes:
-        if node.type == 'GROUP' and node.node_tree:
-            if group_name is None:
-                groups.append(node)
-            elif group_name in node.node_tree.name or node.node_tree.name in group_name:
-                groups.append(node)
-    return groups
+    return list(iter_node_groups(node_tree, group_name))
 
 
 def set_node_input(
@@ -82,10 +157,8 @@ def set_node_input(
         True if successful, False otherwise
     """
     # Try exact match
-    inp = None
-    if input_name in node.inputs:
-        inp = node.inputs[input_name]
-    else:
+    inp = node.inputs.get(input_name)
+    if inp is None:
         # Case-insensitive search as fallback
         for i in node.inputs:
             if i.name.lower() == input_name.lower():
@@ -97,17 +170,81 @@ def set_node_input(
     
     # Remove existing links if present (disabled by default to avoid render crashes)
     if remove_links:
-        node_tree = node.id_data
-        for link in list(node_tree.links):
-            if link.to_socket == inp:
-                node_tree.links.remove(link)
-                break
+        links = inp.links
+        if links:
+            node.id_data.links.remove(links[0])
     
     # Set value
     inp.default_value = value
     return True
 
 
+def map_node_inputs(node: bpy.types.Node) -> Dict[str, bpy.types.NodeSocket]:
+    """
+    Map the input sockets of a node by name for repeated direct access.
+    
+    Lowercase names are added as well so lookups can use the same
+    case-insensitive fallback as set_node_input. The first socket wins
+    for duplicate names, matching node.inputs[name].
+    
+    Args:
+        node: The node whose inputs should be mapped
+        
+    Returns:
+        Dict of input name -> socket
+    """
+    sockets = {}
+    for inp in node.inputs:
+        sockets.setdefault(inp.name, inp)
+    for inp in node.inputs:
+        sockets.setdefault(inp.name.lower(), inp)
+    return sockets
+
+
+def find_mapped_input(
+    sockets: Dict[str, bpy.types.NodeSocket], 
+    input_name: str
+) -> Optional[bpy.types.NodeSocket]:
+    """
+    Look up an input socket in a socket map from map_node_inputs.
+    
+    Args:
+        sockets: Socket map of the node
+        input_name: Name of the input (exact match first, then case-insensitive)
+        
+    Returns:
+        The socket or None
+    """
+    inp = sockets.get(input_name)
+    if inp is None:
+        inp = sockets.get(input_name.lower())
+    return inp
+
+
+def set_mapped_input(
+    sockets: Dict[str, bpy.types.NodeSocket], 
+    input_name: str, 
+    value: Any
+) -> bool:
+    """
+    Set an input value through a socket map from map_node_inputs.
+    
+    Args:
+        sockets: Socket map of the node
+        input_name: Name of the input (exact match first, then case-insensitive)
+        value: The value to set
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    inp = find_mapped_input(sockets, input_name)
+    if inp is None:
+        return False
+    
+    inp.default_value = value
+    return True
+
+
 def get_node_input(node: bpy.types.Node, input_name: str) -> Optional[Any]:
     """
     Read the current value of a node input.
@@ -119,8 +256,9 @@ def get_node_input(node: bpy.types.Node, input_name: str) -> Optional[Any]:
     Returns:
         The current value or None if not found
     """
-    if input_name in node.inputs:
-        return node.inputs[input_name].default_value
+    inp = node.inputs.get(input_name)
+    if inp is not None:
+        return inp.default_value
     
     # Case-insensitive Suche
     for inp in node.inputs:
@@ -130,6 +268,32 @@ def get_node_input(node: bpy.types.Node, input_name: str) -> Optional[Any]:
     return None
 
 
+def get_geometry_node_input_identifier(
+    modifier: bpy.types.Modifier, 
+    input_name: str
+) -> Optional[str]:
+    """
+    Resolve the identifier (e.g. "Socket_1") of a Geometry Nodes modifier input.
+    
+    The result can be cached and used as modifier[identifier] directly,
+    skipping the search over the node group interface on every write.
+    
+    Args:
+        modifier: The Geometry Nodes modifier
+        input_name: Name or identifier of the input (e.g. "Seed" or "Socket_1")
+        
+    Returns:
+        The identifier, or None if the modifier has no node group
+        or no input with that name or identifier.
+    """
+    node_group = modifier.node_group
+    if not node_group:
+        return None
+    
+    names, _ = _geometry_node_inputs(node_group)
+    return names.get(input_name)
+
+
 def set_geometry_node_input(
     obj: bpy.types.Object, 
     modifier_name: str, 
@@ -149,33 +313,48 @@ def set_geometry_node_input(
         True if successful, False otherwise
         
     Note:
-        This function first tries to find the input by display name,
-        then falls back to using the name as identifier directly.
+        The input is looked up by display name first, then by identifier.
+        Unknown inputs are rejected instead of being written as ID properties.
     """
-    modifier = obj.modifiers.get(modifier_name)
-    if not modifier or modifier.type != 'NODES':
-        return False
-    
-    if not modifier.node_group:
-        return False
-    
-    # Find the identifier for the given input name
-    identifier = None
-    for item in modifier.node_group.interface.items_tree:
-        if item.item_type == 'SOCKET' and item.in_out == 'INPUT':
-            if item.name == input_name:
-                identifier = item.identifier
-                break
+    return set_geometry_node_inputs(obj, modifier_name, {input_name: value})
+
+
+def set_geometry_node_inputs(
+    obj: bpy.types.Object, 
+    modifier_name: str, 
+    values: Dict[str, Any]
+) -> bool:
+    """
+    Set several input values of a Geometry Nodes modifier at once.
     
-    # Fallback: try using input_name directly as identifier
-    if identifier is None:
-        identifier = input_name
+    Resolves the modifier and its input identifiers once for all values.
     
-    try:
-        modifier[identifier] = value
-        return True
-    except (KeyError, TypeError):
+    Args:
+        obj: The object with the modifier
+        modifier_name: Name of the Geometry Nodes modifier
+        values: Dict of input name or identifier -> value
+        
+    Returns:
+        True if all values were set, False if the modifier or an input
+        does not exist or a value has an incompatible type
+    """
+    modifier = obj.modifiers.get(modifier_name)
+    if not modifier or modifier.type != 'NODES' or not modifier.node_group:
         return False
+    
+    names, _ = _geometry_node_inputs(modifier.node_group)
+    success = True
+    for input_name, value in values.items():
+        # Unknown inputs are rejected up front: assigning them would only add a stray ID property
+        identifier = names.get(input_name)
+        if identifier is None:
+            success = False
+            continue
+        try:
+            modifier[identifier] = value
+        except TypeError:
+            success = False
+    return success
 
 
 def get_geometry_node_input(
@@ -222,9 +401,5 @@ def list_geometry_node_inputs(
     if not modifier or modifier.type != 'NODES' or not modifier.node_group:
         return []
     
-    inputs = []
-    for item in modifier.node_group.interface.items_tree:
-        if item.item_type == 'SOCKET' and item.in_out == 'INPUT':
-            inputs.append(item.identifier)
-    
-    return inputs
+    _, identifiers = _geometry_node_inputs(modifier.node_group)
+    return list(identifiers)